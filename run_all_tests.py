@@ -18,12 +18,15 @@ Usage:
 Licensed under Anti-Capitalist Software License v1.4
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 import json
 from datetime import datetime
 
+import pytest
+
 def run_pytest():
     """Run all tests with pytest"""
     print("=" * 70)
@@ -35,64 +38,77 @@ def run_pytest():
     # Change to tests directory
     tests_dir = os.path.join(os.path.dirname(__file__), "tests")
     
-    # Run pytest
-    result = subprocess.run(
-        [sys.executable, "-m", "pytest", tests_dir, "-v", "--tb=short"],
-        capture_output=False
-    )
+    # Run pytest (one worker per core via pytest-xdist when installed;
+    # loadfile keeps each module on a single worker)
+    args = [sys.executable, "-m", "pytest", tests_dir, "-v", "--tb=short"]
+    if importlib.util.find_spec("xdist") is not None:
+        args += ["-n", "auto", "--dist=loadfile"]
+    
+    result = subprocess.run(args, capture_output=False)
     
     return result.returncode
 
+class ModuleResultCollector:
+    """pytest plugin recording the outcome of every test, grouped by module
+    
+    A test file that errors during collection counts as a single failed
+    test of that file.
+    """
+    
+    def __init__(self):
+        self.outcomes = {}
+    
+    def pytest_runtest_logreport(self, report):
+        # A failure in any phase (setup/call/teardown) fails the test
+        if report.failed:
+            self.outcomes[report.nodeid] = "failed"
+        elif report.when == "call" and report.nodeid not in self.outcomes:
+            self.outcomes[report.nodeid] = report.outcome
+    
+    def pytest_collectreport(self, report):
+        # A module that fails to import yields no test reports; record it as
+        # one failure so it still shows up (and fails) in the summary
+        if report.failed:
+            self.outcomes[report.nodeid] = "failed"
+    
+    def module_results(self):
+        """Passed/failed/total counts per test file (skipped tests excluded)"""
+        results = {}
+        for nodeid, outcome in self.outcomes.items():
+            test_file = os.path.basename(nodeid.split("::")[0])
+            stats = results.setdefault(test_file, {"passed": 0, "failed": 0, "total": 0})
+            if outcome in ("passed", "failed"):
+                stats[outcome] += 1
+                stats["total"] += 1
+        return results
+
 def run_individual_tests():
-    """Run individual test modules and collect results"""
+    """Run all test modules in one pytest session and collect per-module results"""
     print("=" * 70)
     print("  RUNNING INDIVIDUAL TEST MODULES")
     print("=" * 70)
     print()
     
     tests_dir = os.path.join(os.path.dirname(__file__), "tests")
-    results = {}
     total_passed = 0
     total_tests = 0
     
-    test_files = [
-        "test_section2_constant_frequency.py",
-        "test_section3_first_order_shifts.py",
-        "test_section4_loop_closure.py",
-        "test_section5_relation_to_gr.py",
-        "test_section6_ssz_integration.py",
-        "test_section7_conclusions.py",
-        "test_ssz_physics.py",
-        "test_nsr_ngr_separation.py",
-        "test_dynamic_loops.py",
-        "test_experimental_validation.py",
-    ]
-    
-    for test_file in test_files:
-        test_path = os.path.join(tests_dir, test_file)
-        if os.path.exists(test_path):
-            print(f"Running {test_file}...")
-            result = subprocess.run(
-                [sys.executable, "-m", "pytest", test_path, "-v", "--tb=short"],
-                capture_output=True,
-                text=True
-            )
-            
-            # Parse results
-            passed = result.stdout.count(" PASSED")
-            failed = result.stdout.count(" FAILED")
-            
-            results[test_file] = {
-                "passed": passed,
-                "failed": failed,
-                "total": passed + failed
-            }
-            
-            total_passed += passed
-            total_tests += passed + failed
-            
-            status = "[PASS]" if failed == 0 else "[FAIL]"
-            print(f"  {status} {test_file}: {passed}/{passed+failed}")
+    # One in-process pytest session; counts come from pytest's own test reports
+    collector = ModuleResultCollector()
+    exit_code = pytest.main([tests_dir, "-v", "--tb=short"], plugins=[collector])
+    results = collector.module_results()
+    
+    print()
+    for test_file, stats in results.items():
+        passed, failed = stats["passed"], stats["failed"]
+        
+        total_passed += passed
+        total_tests += passed + failed
+        
+        status = "[PASS]" if failed == 0 else "[FAIL]"
+        print(f"  {status} {test_file}: {passed}/{passed+failed}")
+    
+    pass_rate = total_passed / total_tests if total_tests > 0 else 0
     
     # Summary
     print()
@@ -102,7 +118,9 @@ def run_individual_tests():
     print(f"  Total Tests:  {total_tests}")
     print(f"  Passed:       {total_passed}")
     print(f"  Failed:       {total_tests - total_passed}")
-    print(f"  Pass Rate:    {total_passed/total_tests*100:.1f}%")
+    print(f"  Pass Rate:    {pass_rate*100:.1f}%")
+    if exit_code != 0:
+        print(f"  pytest exit:  {int(exit_code)} (collection/usage errors count as failures)")
     print("=" * 70)
     
     # Save results
@@ -110,7 +128,8 @@ def run_individual_tests():
         "timestamp": datetime.now().isoformat(),
         "total_tests": total_tests,
         "total_passed": total_passed,
-        "pass_rate": total_passed / total_tests if total_tests > 0 else 0,
+        "pass_rate": pass_rate,
+        "pytest_exit_code": int(exit_code),
         "modules": results
     }
     
@@ -119,7 +138,9 @@ def run_individual_tests():
     
     print(f"\nResults saved to: test_results.json")
     
-    return 0 if total_passed == total_tests else 1
+    # A module that fails to import reports no tests at all, so pytest's own
+    # exit code decides as well as the counts
+    return 0 if exit_code == 0 and total_passed == total_tests else 1
 
 def main():
     """Main entry point"""
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared GR Physics for the Test Suite
+====================================
+
+Constants and time-dilation / frequency-shift kernels used by the
+section 2-4 tests, test_dynamic_loops.py and test_experimental_validation.py,
+so the precomputed constants and JIT caches are shared across the suite.
+
+(c) 2025 Carmen Wrede & Lino Casu
+Licensed under Anti-Capitalist Software License v1.4
+"""
+
+import math
+import numpy as np
+from functools import lru_cache
+from typing import Optional
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; kernels then run as plain Python
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    
+    prange = range
+
+# =============================================================================
+# PHYSICAL CONSTANTS
+# =============================================================================
+
+C = 299792458.0              # Speed of light (m/s)
+G = 6.67430e-11              # Gravitational constant
+M_EARTH = 5.972e24           # Earth mass (kg)
+R_EARTH = 6.371e6            # Earth radius (m)
+M_SUN = 1.989e30             # Sun mass (kg)
+R_S_EARTH = 2 * G * M_EARTH / C**2  # Earth Schwarzschild radius (m)
+R_S_SUN = 2 * G * M_SUN / C**2      # Sun Schwarzschild radius (m)
+GM_OVER_C2 = G / C**2        # r_s = 2·GM_OVER_C2·M
+INV_C2 = 1 / C**2
+
+D_CLAMP = 0.01               # D(r) used at/inside r_s
+LOG_D_CLAMP = math.log(D_CLAMP)
+
+# Below this rs/r, √(1 - x) is taken from its Taylor series (error ~ x³/16)
+WEAK_FIELD_X = 1e-6
+
+# =============================================================================
+# PHYSICS FUNCTIONS
+# =============================================================================
+
+def schwarzschild_radius(M: float) -> float:
+    return 2 * G * M / C**2
+
+@njit("float64(float64, float64)", cache=True)
+def _time_dilation_factor_scalar(r: float, r_s: float) -> float:
+    """Scalar D(r) kernel, JIT-compiled when numba is available"""
+    if r <= r_s:
+        return D_CLAMP
+    return math.sqrt(1 - r_s / r)
+
+@njit("float64(float64, float64)", cache=True)
+def _log_time_dilation_scalar(r: float, r_s: float) -> float:
+    """Scalar ln D(r) = ½·log1p(-r_s/r), exact near 0 in the weak field"""
+    if r <= r_s:
+        return LOG_D_CLAMP
+    return 0.5 * math.log1p(-r_s / r)
+
+@njit("float64(float64, float64, float64)", cache=True)
+def _delta_scalar(r_A: float, r_B: float, r_s: float) -> float:
+    """Scalar δ_AB kernel, JIT-compiled when numba is available"""
+    return _log_time_dilation_scalar(r_A, r_s) - _log_time_dilation_scalar(r_B, r_s)
+
+def time_dilation_factor(r: np.ndarray, M: float = M_EARTH,
+                         r_s: Optional[float] = None) -> np.ndarray:
+    """GR time dilation D = √(1 - r_s/r), clamped to 0.01 inside r_s"""
+    if r_s is None:
+        r_s = schwarzschild_radius(M)
+    if np.ndim(r) == 0:
+        return _time_dilation_factor_scalar(float(r), r_s)
+    x = 1 - r_s / np.asarray(r, dtype=float)
+    return np.where(x > 0, np.sqrt(np.maximum(x, 0)), D_CLAMP)
+
+def log_time_dilation_factor(r: np.ndarray, M: float = M_EARTH,
+                             r_s: Optional[float] = None) -> np.ndarray:
+    """ln D(r) = ½·log1p(-r_s/r), clamped like time_dilation_factor"""
+    if r_s is None:
+        r_s = schwarzschild_radius(M)
+    if np.ndim(r) == 0:
+        return _log_time_dilation_scalar(float(r), r_s)
+    x = r_s / np.asarray(r, dtype=float)
+    inside = x >= 1
+    return np.where(inside, LOG_D_CLAMP, 0.5 * np.log1p(-np.where(inside, 0, x)))
+
+def delta_from_positions(r_A: np.ndarray, r_B: np.ndarray, M: float = M_EARTH,
+                         r_s: Optional[float] = None) -> np.ndarray:
+    """
+    δ_AB = ln(D(r_A) / D(r_B)), element-wise over arrays of radii
+    
+    Evaluated as ½·(log1p(-r_s/r_A) - log1p(-r_s/r_B)): in the weak field
+    D ≈ 1, and log1p keeps full precision where ln(D_A/D_B) would not.
+    """
+    if r_s is None:
+        r_s = schwarzschild_radius(M)
+    if np.ndim(r_A) == 0 and np.ndim(r_B) == 0:
+        return _delta_scalar(float(r_A), float(r_B), r_s)
+    return log_time_dilation_factor(r_A, r_s=r_s) - log_time_dilation_factor(r_B, r_s=r_s)
+
+@njit("float64(float64, float64)", cache=True)
+def delta_earth(r_A: float, r_B: float) -> float:
+    """
+    δ_AB for two scalar radii around the Earth
+    
+    Specialization of delta_from_positions(r_A, r_B, M_EARTH): r_s is
+    fixed to R_S_EARTH (a compile-time constant under numba), so there is
+    no mass argument, Schwarzschild-radius or ndim dispatch per call.
+    """
+    return _log_time_dilation_scalar(r_A, R_S_EARTH) - _log_time_dilation_scalar(r_B, R_S_EARTH)
+
+# GR prediction for the frequency shift δ = ln(D(r1)/D(r2))
+gr_frequency_shift = delta_from_positions
+
+# =============================================================================
+# FREQUENCY COMPARISONS (Sections 2-4)
+# =============================================================================
+
+@njit("float64(float64, float64)", cache=True)
+def delta_AB(freq_A: float, freq_B: float) -> float:
+    """
+    Relational frequency observable (Equation 2).
+    delta_AB = ln(nu_A / nu_B)
+    """
+    return math.log(freq_A / freq_B)
+
+@njit("float64(float64, float64, float64)", cache=True)
+def I_ABC(freq_A: float, freq_B: float, freq_C: float) -> float:
+    """
+    Closed-loop residual (Equation 3).
+    I_ABC = delta_AB + delta_BC + delta_CA
+    
+    Inlined with math.log: scalar inputs, no ufunc dispatch per term.
+    """
+    return math.log(freq_A / freq_B) + math.log(freq_B / freq_C) + math.log(freq_C / freq_A)
+
+@njit(cache=True)
+def gravitational_redshift(r1: float, r2: float, rs: float = R_S_EARTH) -> float:
+    """
+    First-order gravitational redshift between two radii.
+    Deltaν/ν = GM/c^2 x (1/r1 - 1/r2) = (rs/2) x (1/r1 - 1/r2)
+    """
+    return (rs / 2) * (1/r1 - 1/r2)
+
+@njit("float64(float64, float64, float64)", cache=True)
+def _frequency_shift(freq_0: float, r: float, rs: float) -> float:
+    """ν₀ x √(1 - rs/r) kernel behind gravitational_frequency (r > rs)"""
+    x = rs / r
+    if x < WEAK_FIELD_X:
+        return freq_0 * (1 - 0.5*x - 0.125*x*x)  # √(1-x) to O(x³)
+    return freq_0 * math.sqrt(1 - x)
+
+@lru_cache(maxsize=128)
+def gravitational_frequency(freq_0: float, r: float, rs: float = R_S_EARTH) -> float:
+    """
+    Frequency at radius r in gravitational field.
+    ν(r) = ν₀ x √(1 - rs/r) ~ ν₀ x (1 - rs/(2r)) for weak field
+    
+    Memoised: the table and tests reuse a handful of (ν₀, r, rs) triples.
+    """
+    if r <= rs:
+        raise ValueError(f"r={r} is inside Schwarzschild radius rs={rs}")
+    return _frequency_shift(freq_0, r, rs)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Shared Results Reporting
+========================
+
+report() prints the [PASS]/[FAIL] line of a section test result, followed
+by its detail (the measured values) for either outcome.
+
+dump_json() writes a results dict with orjson when it is installed and
+falls back to the standard json module otherwise. The payload is first
+normalised to plain JSON values (numpy scalars/arrays → Python values,
+np.bool_ → bool, dataclasses → dicts, NaN/inf → null, anything else →
+str()), so both backends write the same data; only the float spelling
+may differ (orjson writes 1e-8 where json writes 1e-08).
+
+(c) 2025 Carmen Wrede & Lino Casu
+Licensed under Anti-Capitalist Software License v1.4
+"""
+
+import dataclasses
+import json
+import math
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def report(result, detail: str = "") -> None:
+    """Print the [PASS]/[FAIL] line of a result, with its detail if given"""
+    print(f"[{'PASS' if result.passed else 'FAIL'}] {result.name}" + (f": {detail}" if detail else ""))
+
+def _jsonable(obj):
+    """Plain-JSON copy of `obj`, identical for both backends"""
+    if isinstance(obj, dict):
+        return {str(k): _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    if isinstance(obj, np.ndarray):
+        return _jsonable(obj.tolist())
+    if isinstance(obj, np.generic):
+        obj = obj.item()
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if obj is None or isinstance(obj, (bool, int, str)):
+        return obj
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _jsonable({f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)})
+    return str(obj)
+
+def dump_json(obj, path: str) -> None:
+    """Write `obj` to `path` as 2-space indented JSON"""
+    obj = _jsonable(obj)
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, "w") as f:
+            json.dump(obj, f, indent=2)
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+"""
+Pytest hooks shared by the validation suite
+
+(c) 2025 Carmen Wrede & Lino Casu
+Licensed under Anti-Capitalist Software License v1.4
+"""
+
+import importlib
+import json
+import sys
+
+import pytest
+
+_DYNAMIC_MODULE = "tests.test_dynamic_loops"
+_WORKER_OUTPUT_KEY = "dynamic_loop_results"
+
+# Names of the dynamic-loop tests whose call phase ran; under pytest-xdist
+# the controller receives every worker's reports, so it sees them all
+_dynamic_tests_run = set()
+
+# Results sent back by pytest-xdist workers, merged in the controller
+_worker_results = {}
+
+
+def pytest_runtest_logreport(report):
+    if report.when == "call" and report.nodeid.split("::")[0].endswith("test_dynamic_loops.py"):
+        _dynamic_tests_run.add(report.nodeid.split("::")[-1])
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """Controller side of pytest-xdist: collect a finished worker's results"""
+    _worker_results.update(getattr(node, "workeroutput", {}).get(_WORKER_OUTPUT_KEY, {}))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """
+    Write the dynamic-loop results once, after all tests have run.
+    
+    The tests only record their summaries in memory. A pytest-xdist worker
+    hands its results to the controller through workeroutput (as plain
+    JSON values, encoded the way save_results() encodes them); the
+    controller, or the single process of a serial run, writes the file.
+    It is written only when every test of test_dynamic_loops.py ran, so
+    -k subsets, deselections and runs stopped early never overwrite a full
+    result file with a partial one.
+    """
+    module = sys.modules.get(_DYNAMIC_MODULE)
+    
+    if hasattr(session.config, "workerinput"):
+        if module is not None and module.RESULTS:
+            session.config.workeroutput[_WORKER_OUTPUT_KEY] = json.loads(
+                json.dumps(module.RESULTS, default=str))
+        return
+    
+    if not _worker_results and (module is None or not module.RESULTS):
+        return
+    # Under xdist the controller never ran (or imported) the module itself
+    module = importlib.import_module(_DYNAMIC_MODULE)
+    all_tests = {name for name in vars(module) if name.startswith("test_")}
+    if all_tests <= _dynamic_tests_run:
+        module.RESULTS.update(_worker_results)
+        module.save_results()
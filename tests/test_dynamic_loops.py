@@ -11,19 +11,22 @@ Tests temporal evolution of frequency comparisons along trajectories.
 Licensed under Anti-Capitalist Software License v1.4
 """
 
+import os
+import sys
 import numpy as np
+import pytest
 from dataclasses import dataclass
-from typing import List, Tuple, Callable
+from functools import lru_cache
+from typing import List, Tuple
 import json
 
-# =============================================================================
-# PHYSICAL CONSTANTS
-# =============================================================================
-
-C = 299792458.0              # Speed of light (m/s)
-G = 6.67430e-11              # Gravitational constant
-M_EARTH = 5.972e24           # Earth mass (kg)
-R_EARTH = 6.371e6            # Earth radius (m)
+try:
+    from ._physics import (G, M_EARTH, R_EARTH, R_S_EARTH,
+                           log_time_dilation_factor, delta_earth)
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import (G, M_EARTH, R_EARTH, R_S_EARTH,
+                                log_time_dilation_factor, delta_earth)
 
 # =============================================================================
 # DATA CLASSES
@@ -31,28 +34,57 @@ R_EARTH = 6.371e6            # Earth radius (m)
 
 @dataclass
 class TrajectoryPoint:
-    """Point along a trajectory"""
-    t: float                 # Time (s)
-    r: float                 # Radial distance (m)
-    v: float                 # Velocity (m/s)
-    theta: float             # Angular position (rad)
+    """Point (or batch of points) along a trajectory, one array per field"""
+    __slots__ = ("t", "r", "v", "theta")
+    
+    t: np.ndarray            # Time (s)
+    r: np.ndarray            # Radial distance (m)
+    v: np.ndarray            # Velocity (m/s)
+    theta: np.ndarray        # Angular position (rad)
 
 @dataclass
 class DynamicLoopResult:
     """Result of dynamic loop integration"""
     trajectory_name: str
-    times: List[float]
-    delta_values: List[float]
-    I_ABC_values: List[float]
+    times: np.ndarray
+    delta_values: np.ndarray
+    I_ABC_values: np.ndarray
     is_integrable: bool      # Does path integral vanish?
     max_residual: float
     description: str
 
+# =============================================================================
+# RESULT COLLECTION
+# =============================================================================
+
+RESULTS_FILE = "dynamic_loop_results.json"
+
+# Filled in by each test and written once per run by save_results(), either
+# from run_all_dynamic_tests() or from pytest_sessionfinish in conftest.py
+# (the latter only after a complete run of this module; pytest-xdist workers
+# pass their results to the controller, which writes the file)
+RESULTS = {}
+
+def record_result(key: str, result) -> None:
+    """Store the JSON summary of a test result for the deferred write"""
+    if isinstance(result, DynamicLoopResult):
+        result = {
+            "max_residual": result.max_residual,
+            "is_integrable": result.is_integrable,
+            "description": result.description
+        }
+    RESULTS[key] = result
+
+def save_results(filename: str = RESULTS_FILE) -> None:
+    """Write all recorded results in a single json.dump"""
+    with open(filename, "w") as f:
+        json.dump(RESULTS, f, indent=2, default=str)
+
 # =============================================================================
 # TRAJECTORY GENERATORS
 # =============================================================================
 
-def gravity_probe_a_trajectory(t: float) -> TrajectoryPoint:
+def gravity_probe_a_trajectory(t: np.ndarray) -> TrajectoryPoint:
     """
     Gravity Probe A trajectory (1976)
     Suborbital rocket: max altitude ~10,000 km
@@ -63,14 +95,14 @@ def gravity_probe_a_trajectory(t: float) -> TrajectoryPoint:
     
     # Height as function of time (ballistic)
     h = v0 * t - 0.5 * g * t**2
-    h = max(0, h)  # Don't go below surface
+    h = np.maximum(0, h)  # Don't go below surface
     
     r = R_EARTH + h
     v = v0 - g * t
     
-    return TrajectoryPoint(t=t, r=r, v=abs(v), theta=0)
+    return TrajectoryPoint(t=t, r=r, v=np.abs(v), theta=0)
 
-def galileo_eccentric_orbit(t: float) -> TrajectoryPoint:
+def galileo_eccentric_orbit(t: np.ndarray) -> TrajectoryPoint:
     """
     Galileo 5/6 eccentric orbit
     Perigee: ~17,000 km, Apogee: ~26,000 km
@@ -84,23 +116,30 @@ def galileo_eccentric_orbit(t: float) -> TrajectoryPoint:
     # Mean anomaly
     M = 2 * np.pi * t / T
     
-    # Eccentric anomaly (Newton's method)
-    E = M
-    for _ in range(10):
-        E = M + e * np.sin(E)
-    
-    # True anomaly
+    # Eccentric anomaly: Newton-Raphson on Kepler's equation E - e·sin(E) = M
+    E = M + e * np.sin(M)
+    for _ in range(5):
+        sin_E, cos_E = np.sin(E), np.cos(E)
+        dE = (E - e * sin_E - M) / (1 - e * cos_E)
+        E = E - dE
+        if np.max(np.abs(dE)) < 1e-12:
+            break
+    # Rotate sin/cos through the last (tiny) step instead of re-evaluating
+    # them; the dropped terms are O(dE²).
+    sin_E, cos_E = sin_E - cos_E * dE, cos_E + sin_E * dE
+    
+    # True anomaly (half angles of E stay well conditioned as E -> π)
     theta = 2 * np.arctan2(np.sqrt(1+e) * np.sin(E/2), np.sqrt(1-e) * np.cos(E/2))
     
     # Radius
-    r = a * (1 - e * np.cos(E))
+    r = a * (1 - e * cos_E)
     
     # Velocity (vis-viva)
     v = np.sqrt(G * M_EARTH * (2/r - 1/a))
     
     return TrajectoryPoint(t=t, r=r, v=v, theta=theta)
 
-def iss_orbit(t: float) -> TrajectoryPoint:
+def iss_orbit(t: np.ndarray) -> TrajectoryPoint:
     """
     ISS circular orbit
     Altitude: ~400 km, Period: ~92 min
@@ -114,7 +153,7 @@ def iss_orbit(t: float) -> TrajectoryPoint:
     
     return TrajectoryPoint(t=t, r=r, v=v, theta=theta)
 
-def gps_orbit(t: float) -> TrajectoryPoint:
+def gps_orbit(t: np.ndarray) -> TrajectoryPoint:
     """
     GPS satellite orbit
     Altitude: ~20,200 km, Period: ~12 hours
@@ -128,62 +167,94 @@ def gps_orbit(t: float) -> TrajectoryPoint:
     
     return TrajectoryPoint(t=t, r=r, v=v, theta=theta)
 
-# =============================================================================
-# PHYSICS FUNCTIONS
-# =============================================================================
+def ground_station(t: np.ndarray) -> TrajectoryPoint:
+    """
+    Static ground clock on Earth's surface
+    """
+    return TrajectoryPoint(t=t, r=R_EARTH, v=0, theta=0)
 
-def schwarzschild_radius(M: float) -> float:
-    return 2 * G * M / C**2
+# Trajectories by name, so their sampled ln D(r) can be cached per time grid
+TRAJECTORIES = {
+    "ground": ground_station,
+    "gravity_probe_a": gravity_probe_a_trajectory,
+    "galileo": galileo_eccentric_orbit,
+    "iss": iss_orbit,
+    "gps": gps_orbit,
+}
 
-def time_dilation_factor(r: float, M: float) -> float:
-    """GR time dilation D = √(1 - r_s/r)"""
-    r_s = schwarzschild_radius(M)
-    if r <= r_s:
-        return 0.01
-    return np.sqrt(1 - r_s / r)
+@lru_cache(maxsize=None)
+def _time_grid(t_start: float, t_end: float, n_points: int) -> np.ndarray:
+    """
+    Shared, read-only np.linspace(t_start, t_end, n_points)
+    
+    Cached so every trajectory and test sampled on the same grid reuses
+    one buffer.
+    """
+    times = np.linspace(t_start, t_end, n_points)
+    times.flags.writeable = False
+    return times
 
-def delta_from_positions(r_A: float, r_B: float, M: float) -> float:
-    """δ_AB = ln(D(r_A) / D(r_B))"""
-    D_A = time_dilation_factor(r_A, M)
-    D_B = time_dilation_factor(r_B, M)
-    return np.log(D_A / D_B)
+@lru_cache(maxsize=None)
+def _log_dilation_samples(name: str, t_start: float, t_end: float, n_points: int):
+    """
+    ln D(r(t)) of a named trajectory on np.linspace(t_start, t_end, n_points)
+    
+    Cached per (name, t_start, t_end, n_points); arrays are returned
+    read-only because they are shared between callers. Legs with constant
+    r (ground station, circular orbits) yield a scalar, so D is evaluated
+    once instead of at every sample.
+    """
+    times = _time_grid(t_start, t_end, n_points)
+    log_D = log_time_dilation_factor(TRAJECTORIES[name](times).r, r_s=R_S_EARTH)
+    if isinstance(log_D, np.ndarray):
+        log_D.flags.writeable = False
+    return log_D
 
 # =============================================================================
 # DYNAMIC LOOP TESTS
 # =============================================================================
 
 def compute_dynamic_loop(
-    trajectory_A: Callable[[float], TrajectoryPoint],
-    trajectory_B: Callable[[float], TrajectoryPoint],
-    trajectory_C: Callable[[float], TrajectoryPoint],
+    trajectory_A: str,
+    trajectory_B: str,
+    trajectory_C: str,
     t_start: float,
     t_end: float,
     n_points: int = 100
-) -> Tuple[List[float], List[float], List[float], List[float]]:
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
     """
-    Compute δ_AB(t), δ_BC(t), δ_CA(t) and I_ABC(t) along trajectories
+    Compute δ_AB(t), δ_BC(t), δ_CA(t) along trajectories
+    
+    Trajectories are given by their TRAJECTORIES name and evaluated once
+    on the full time grid, so every δ(t) series is a single vectorized
+    NumPy expression. The loop residual I_ABC = δ_AB + δ_BC + δ_CA is
+    left to the tests that check it.
     """
-    times = np.linspace(t_start, t_end, n_points)
-    delta_AB = []
-    delta_BC = []
-    delta_CA = []
-    I_ABC = []
-    
-    for t in times:
-        A = trajectory_A(t)
-        B = trajectory_B(t)
-        C = trajectory_C(t)
-        
-        d_AB = delta_from_positions(A.r, B.r, M_EARTH)
-        d_BC = delta_from_positions(B.r, C.r, M_EARTH)
-        d_CA = delta_from_positions(C.r, A.r, M_EARTH)
-        
-        delta_AB.append(d_AB)
-        delta_BC.append(d_BC)
-        delta_CA.append(d_CA)
-        I_ABC.append(d_AB + d_BC + d_CA)
-    
-    return list(times), delta_AB, delta_BC, delta_CA, I_ABC
+    # Resolve the names first, so a misspelt leg raises KeyError even when
+    # the shortcut below would never look it up
+    for name in (trajectory_A, trajectory_B, trajectory_C):
+        if name not in TRAJECTORIES:
+            raise KeyError(name)
+    
+    times = _time_grid(t_start, t_end, n_points)
+    
+    # Three copies of one trajectory share r(t): every δ vanishes identically
+    if trajectory_A == trajectory_B == trajectory_C:
+        return times, np.zeros_like(times), np.zeros_like(times), np.zeros_like(times)
+    
+    # ln D is tabulated once per leg; δ_XY = ln D_X - ln D_Y
+    log_D_A, log_D_B, log_D_C = np.broadcast_arrays(
+        _log_dilation_samples(trajectory_A, t_start, t_end, n_points),
+        _log_dilation_samples(trajectory_B, t_start, t_end, n_points),
+        _log_dilation_samples(trajectory_C, t_start, t_end, n_points),
+        times
+    )[:3]
+    
+    delta_AB = log_D_A - log_D_B
+    delta_BC = log_D_B - log_D_C
+    delta_CA = log_D_C - log_D_A
+    
+    return times, delta_AB, delta_BC, delta_CA
 
 def test_gravity_probe_a_dynamic():
     """
@@ -194,22 +265,19 @@ def test_gravity_probe_a_dynamic():
     print("TEST 1: Gravity Probe A Dynamic Loop")
     print("="*70)
     
-    # Trajectories
-    def ground(t): return TrajectoryPoint(t=t, r=R_EARTH, v=0, theta=0)
-    def gpa(t): return gravity_probe_a_trajectory(t)
-    def gps(t): return gps_orbit(t)
-    
     # Compute over 2 hours (GP-A flight time)
     t_end = 2 * 3600
-    times, d_AB, d_BC, d_CA, I = compute_dynamic_loop(ground, gpa, gps, 0, t_end, 50)
+    times, d_AB, d_BC, d_CA = compute_dynamic_loop("ground", "gravity_probe_a", "gps", 0, t_end, 50)
+    I = d_AB + d_BC + d_CA
     
-    max_I = max(abs(i) for i in I)
-    mean_I = np.mean(np.abs(I))
+    abs_I = np.abs(I)
+    max_I = abs_I.max()
+    mean_I = abs_I.mean()
     
     print(f"  Time span: 0 - {t_end/3600:.1f} hours")
-    print(f"  δ_AB(t) range: [{min(d_AB):.6e}, {max(d_AB):.6e}]")
-    print(f"  δ_BC(t) range: [{min(d_BC):.6e}, {max(d_BC):.6e}]")
-    print(f"  δ_CA(t) range: [{min(d_CA):.6e}, {max(d_CA):.6e}]")
+    print(f"  δ_AB(t) range: [{d_AB.min():.6e}, {d_AB.max():.6e}]")
+    print(f"  δ_BC(t) range: [{d_BC.min():.6e}, {d_BC.max():.6e}]")
+    print(f"  δ_CA(t) range: [{d_CA.min():.6e}, {d_CA.max():.6e}]")
     print(f"  ─────────────────────────────────────────────")
     print(f"  I_ABC(t) max:  {max_I:.6e}")
     print(f"  I_ABC(t) mean: {mean_I:.6e}")
@@ -227,6 +295,7 @@ def test_gravity_probe_a_dynamic():
         max_residual=max_I,
         description="Ground-Rocket-GPS triangle over 2 hour flight"
     )
+    record_result("gravity_probe_a", result)
     
     return result, passed
 
@@ -240,23 +309,20 @@ def test_galileo_eccentric_dynamic():
     print("="*70)
     
     # Trajectories: Ground, Galileo (eccentric), GPS (circular reference)
-    def ground(t): return TrajectoryPoint(t=t, r=R_EARTH, v=0, theta=0)
-    def galileo(t): return galileo_eccentric_orbit(t)
-    def gps(t): return gps_orbit(t)
-    
     # Compute over 1 full orbit (~13 hours)
     T_orbit = 12.9 * 3600
-    times, d_AB, d_BC, d_CA, I = compute_dynamic_loop(ground, galileo, gps, 0, T_orbit, 100)
+    times, d_AB, d_BC, d_CA = compute_dynamic_loop("ground", "galileo", "gps", 0, T_orbit, 100)
+    I = d_AB + d_BC + d_CA
     
-    max_I = max(abs(i) for i in I)
+    max_I = np.abs(I).max()
     
     # The key observable: δ modulation due to eccentricity
-    delta_amplitude = max(d_AB) - min(d_AB)
+    delta_amplitude = np.ptp(d_AB)
     
     print(f"  Orbit period: {T_orbit/3600:.1f} hours")
     print(f"  δ_AB amplitude (eccentricity signal): {delta_amplitude:.6e}")
-    print(f"  δ_AB(perigee):  {max(d_AB):.6e}")
-    print(f"  δ_AB(apogee):   {min(d_AB):.6e}")
+    print(f"  δ_AB(perigee):  {d_AB.max():.6e}")
+    print(f"  δ_AB(apogee):   {d_AB.min():.6e}")
     print(f"  ─────────────────────────────────────────────")
     print(f"  I_ABC(t) max:   {max_I:.6e}")
     print(f"  Loop Closure:   {'✅ HOLDS' if max_I < 1e-14 else '⚠️ RESIDUAL'}")
@@ -272,6 +338,7 @@ def test_galileo_eccentric_dynamic():
         max_residual=max_I,
         description=f"Full orbit, δ amplitude = {delta_amplitude:.2e}"
     )
+    record_result("galileo_eccentric", result)
     
     return result, passed
 
@@ -284,15 +351,12 @@ def test_iss_gps_ground_dynamic():
     print("TEST 3: ISS-GPS-Ground Dynamic Triangle")
     print("="*70)
     
-    def ground(t): return TrajectoryPoint(t=t, r=R_EARTH, v=0, theta=0)
-    def iss(t): return iss_orbit(t)
-    def gps(t): return gps_orbit(t)
-    
     # Compute over 1 day
     t_end = 24 * 3600
-    times, d_AB, d_BC, d_CA, I = compute_dynamic_loop(ground, iss, gps, 0, t_end, 200)
+    times, d_AB, d_BC, d_CA = compute_dynamic_loop("ground", "iss", "gps", 0, t_end, 200)
+    I = d_AB + d_BC + d_CA
     
-    max_I = max(abs(i) for i in I)
+    max_I = np.abs(I).max()
     
     print(f"  Time span: 24 hours")
     print(f"  ISS orbits: ~16")
@@ -312,6 +376,7 @@ def test_iss_gps_ground_dynamic():
         max_residual=max_I,
         description="24 hour observation, multiple orbital periods"
     )
+    record_result("iss_gps_ground", result)
     
     return result, passed
 
@@ -330,26 +395,25 @@ def test_path_integral_independence():
     r_A = R_EARTH
     r_B = R_EARTH + 20200e3
     
-    # Path 1: Direct radial
+    # Path 1: Direct radial (sum of step-wise δ over adjacent radii)
+    # ln D(r) is tabulated once per path; each step is δ = lnD[i] - lnD[i+1]
     n_steps = 100
     radii_direct = np.linspace(r_A, r_B, n_steps)
-    integral_direct = 0
-    for i in range(n_steps - 1):
-        integral_direct += delta_from_positions(radii_direct[i], radii_direct[i+1], M_EARTH)
+    lnD_direct = log_time_dilation_factor(radii_direct, r_s=R_S_EARTH)
+    integral_direct = np.sum(lnD_direct[:-1] - lnD_direct[1:])
     
     # Path 2: Via intermediate altitude (zigzag)
     r_mid = R_EARTH + 10000e3
     radii_path2_up = np.linspace(r_A, r_mid, n_steps//2)
     radii_path2_down = np.linspace(r_mid, r_B, n_steps//2)
+    lnD_up = log_time_dilation_factor(radii_path2_up, r_s=R_S_EARTH)
+    lnD_down = log_time_dilation_factor(radii_path2_down, r_s=R_S_EARTH)
     
-    integral_path2 = 0
-    for i in range(len(radii_path2_up) - 1):
-        integral_path2 += delta_from_positions(radii_path2_up[i], radii_path2_up[i+1], M_EARTH)
-    for i in range(len(radii_path2_down) - 1):
-        integral_path2 += delta_from_positions(radii_path2_down[i], radii_path2_down[i+1], M_EARTH)
+    integral_path2 = (np.sum(lnD_up[:-1] - lnD_up[1:])
+                      + np.sum(lnD_down[:-1] - lnD_down[1:]))
     
     # Direct calculation (should match both)
-    delta_direct = delta_from_positions(r_A, r_B, M_EARTH)
+    delta_direct = delta_earth(r_A, r_B)
     
     diff_1 = abs(integral_direct - delta_direct)
     diff_2 = abs(integral_path2 - delta_direct)
@@ -367,7 +431,19 @@ def test_path_integral_independence():
     
     passed = diff_paths < 1e-14
     
-    return {"diff_paths": diff_paths, "passed": passed}, passed
+    result = {"diff_paths": diff_paths, "passed": passed}
+    record_result("path_independence", result)
+    
+    return result, passed
+
+def test_identical_legs_shortcut():
+    """Identical legs give three separate zero series; unknown names still raise"""
+    times, d_AB, d_BC, d_CA = compute_dynamic_loop("gps", "gps", "gps", 0, 3600, 10)
+    
+    assert not np.shares_memory(d_AB, d_BC) and not np.shares_memory(d_BC, d_CA)
+    assert not np.any(d_AB) and not np.any(d_BC) and not np.any(d_CA)
+    with pytest.raises(KeyError):
+        compute_dynamic_loop("gsp", "gsp", "gsp", 0, 3600, 10)
 
 # =============================================================================
 # MAIN EXECUTION
@@ -380,39 +456,23 @@ def run_all_dynamic_tests():
     print("  Paper: 'Frequency-Based Curvature Detection via Dynamic Comparisons'")
     print("="*70)
     
-    all_results = {}
+    RESULTS.clear()
     all_passed = True
     
     # Test 1: Gravity Probe A
     r1, p1 = test_gravity_probe_a_dynamic()
-    all_results["gravity_probe_a"] = {
-        "max_residual": r1.max_residual,
-        "is_integrable": r1.is_integrable,
-        "description": r1.description
-    }
     all_passed = all_passed and p1
     
     # Test 2: Galileo eccentric
     r2, p2 = test_galileo_eccentric_dynamic()
-    all_results["galileo_eccentric"] = {
-        "max_residual": r2.max_residual,
-        "is_integrable": r2.is_integrable,
-        "description": r2.description
-    }
     all_passed = all_passed and p2
     
     # Test 3: ISS-GPS-Ground
     r3, p3 = test_iss_gps_ground_dynamic()
-    all_results["iss_gps_ground"] = {
-        "max_residual": r3.max_residual,
-        "is_integrable": r3.is_integrable,
-        "description": r3.description
-    }
     all_passed = all_passed and p3
     
     # Test 4: Path independence
     r4, p4 = test_path_integral_independence()
-    all_results["path_independence"] = r4
     all_passed = all_passed and p4
     
     # Summary
@@ -434,11 +494,10 @@ def run_all_dynamic_tests():
     print("  This confirms the path-independence (integrability) of δ.")
     
     # Save results
-    with open("dynamic_loop_results.json", "w") as f:
-        json.dump(all_results, f, indent=2, default=str)
-    print(f"\n  Results saved to: dynamic_loop_results.json")
+    save_results()
+    print(f"\n  Results saved to: {RESULTS_FILE}")
     
-    return all_results, all_passed
+    return dict(RESULTS), all_passed
 
 if __name__ == "__main__":
     run_all_dynamic_tests()
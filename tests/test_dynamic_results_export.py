@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Dynamic-Loop Results Export Tests (conftest hooks, serial and pytest-xdist)
+(c) 2025 Carmen Wrede & Lino Casu - ACSL v1.4
+"""
+import json
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from . import conftest, test_dynamic_loops
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _report_all_dynamic_tests():
+    for name in vars(test_dynamic_loops):
+        if name.startswith("test_"):
+            conftest.pytest_runtest_logreport(SimpleNamespace(
+                when="call", nodeid=f"tests/test_dynamic_loops.py::{name}"))
+
+def test_worker_results_are_written_by_controller(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(conftest, "_dynamic_tests_run", set())
+    monkeypatch.setattr(conftest, "_worker_results", {})
+    monkeypatch.setattr(test_dynamic_loops, "RESULTS", {
+        "galileo_eccentric": {"max_residual": np.float64(1e-17), "passed": np.bool_(True)}})
+    results_file = tmp_path / test_dynamic_loops.RESULTS_FILE
+    
+    # Worker: hands plain JSON values to the controller, writes nothing
+    worker = SimpleNamespace(config=SimpleNamespace(workerinput={}, workeroutput={}))
+    conftest.pytest_sessionfinish(worker, 0)
+    payload = worker.config.workeroutput[conftest._WORKER_OUTPUT_KEY]
+    assert json.loads(json.dumps(payload)) == payload
+    assert not results_file.exists()
+    
+    # Controller: never ran the module itself
+    monkeypatch.setattr(test_dynamic_loops, "RESULTS", {})
+    conftest.pytest_testnodedown(SimpleNamespace(workeroutput=worker.config.workeroutput), None)
+    controller = SimpleNamespace(config=SimpleNamespace())
+    
+    conftest.pytest_sessionfinish(controller, 0)
+    assert not results_file.exists()  # no dynamic-loop test reported yet
+    
+    _report_all_dynamic_tests()
+    conftest.pytest_sessionfinish(controller, 0)
+    with open(results_file) as f:
+        assert json.load(f) == {"galileo_eccentric": {"max_residual": 1e-17, "passed": "True"}}
+
+def test_xdist_run_writes_results(tmp_path):
+    pytest.importorskip("xdist")
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+         "-n", "2", "--dist=loadfile", os.path.join(TESTS_DIR, "test_dynamic_loops.py")],
+        cwd=tmp_path, check=True, capture_output=True)
+    with open(tmp_path / test_dynamic_loops.RESULTS_FILE) as f:
+        assert set(json.load(f)) == {"gravity_probe_a", "galileo_eccentric",
+                                     "iss_gps_ground", "path_independence"}
@@ -17,19 +17,23 @@ Paper Reference: "Frequency-Based Curvature Detection via Dynamic Comparisons"
 Licensed under Anti-Capitalist Software License v1.4
 """
 
+import io
+import os
+import sys
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Optional
-import json
+from typing import Optional, TextIO
 
-# =============================================================================
-# PHYSICAL CONSTANTS
-# =============================================================================
-
-C = 299792458.0              # Speed of light (m/s)
-G = 6.67430e-11              # Gravitational constant
-M_EARTH = 5.972e24           # Earth mass (kg)
-R_EARTH = 6.371e6            # Earth radius (m)
+try:
+    from ._physics import (C, G, M_EARTH, R_EARTH, R_S_EARTH,
+                           schwarzschild_radius, gr_frequency_shift, delta_earth)
+    from ._results import dump_json
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import (C, G, M_EARTH, R_EARTH, R_S_EARTH,
+                                schwarzschild_radius, gr_frequency_shift, delta_earth)
+    from tests._results import dump_json
 
 # =============================================================================
 # EXPERIMENTAL DATA (REAL MEASUREMENTS)
@@ -139,19 +143,43 @@ ALL_EXPERIMENTS = [
 # PHYSICS FUNCTIONS
 # =============================================================================
 
-def schwarzschild_radius(M: float) -> float:
-    return 2 * G * M / C**2
+def gr_frequency_shift_weak(r1, r2, M):
+    """Weak field approximation: Δf/f ≈ GM/c² × (1/r1 - 1/r2) (scalars or arrays)"""
+    return G * M / C**2 * (1/r1 - 1/r2)
 
-def gr_frequency_shift(r1: float, r2: float, M: float) -> float:
-    """GR prediction for frequency shift δ = ln(D(r1)/D(r2))"""
-    r_s = schwarzschild_radius(M)
-    D1 = np.sqrt(1 - r_s / r1)
-    D2 = np.sqrt(1 - r_s / r2)
-    return np.log(D1 / D2)
+def gr_frequency_shift_taylor(r1, r2, M):
+    """
+    Leading-order shift Δf/f ≈ g·h/c², with g = GM/r² at the midpoint
+    
+    Relative error vs the weak-field form is (h/2r)², negligible at tower heights.
+    """
+    r_mid = 0.5 * (r1 + r2)
+    return G * M / C**2 * (r2 - r1) / r_mid**2
 
-def gr_frequency_shift_weak(r1: float, r2: float, M: float) -> float:
-    """Weak field approximation: Δf/f ≈ GM/c² × (1/r1 - 1/r2)"""
-    return G * M / C**2 * (1/r1 - 1/r2)
+# Height of the upper clock above the ground clock for the ground-referenced
+# weak-field experiments (m)
+WEAK_FIELD_HEIGHTS = {
+    "gravity_probe_a": 10000e3,
+    "pound_rebka": 22.5,
+    "tokyo_skytree": 450,
+}
+
+# Below this h/r the Taylor form is used (error ≤ 2.5e-7, far inside every σ)
+TAYLOR_MAX_H_OVER_R = 1e-3
+
+def weak_field_predictions(heights: dict = WEAK_FIELD_HEIGHTS) -> dict:
+    """|Δf/f| for every experiment in `heights`, computed in one NumPy pass"""
+    names = list(heights)
+    r1 = np.full(len(names), R_EARTH)
+    h = np.array([heights[name] for name in names], dtype=float)
+    r2 = R_EARTH + h
+    M = np.full(len(names), M_EARTH)
+    preds = np.abs(np.where(h < TAYLOR_MAX_H_OVER_R * r1,
+                            gr_frequency_shift_taylor(r1, r2, M),
+                            gr_frequency_shift_weak(r1, r2, M)))
+    return dict(zip(names, preds.tolist()))
+
+WEAK_FIELD_PREDICTIONS = weak_field_predictions()
 
 def calculate_delta_with_uncertainty(
     r1: float, r2: float, M: float,
@@ -173,25 +201,25 @@ def calculate_delta_with_uncertainty(
 # VALIDATION TESTS
 # =============================================================================
 
-def validate_gravity_probe_a():
+def validate_gravity_probe_a(out: Optional[TextIO] = None):
     """
     Validate against Gravity Probe A (1976)
     
     Setup: H-maser at 10,000 km altitude vs ground
     """
-    print("\n" + "="*70)
-    print("EXPERIMENT 1: Gravity Probe A (1976)")
-    print("="*70)
+    print("\n" + "="*70, file=out)
+    print("EXPERIMENT 1: Gravity Probe A (1976)", file=out)
+    print("="*70, file=out)
     
     exp = GRAVITY_PROBE_A
     
     # Calculate our prediction
-    h_max = 10000e3  # Maximum altitude
+    h_max = WEAK_FIELD_HEIGHTS["gravity_probe_a"]  # Maximum altitude
     r1 = R_EARTH
     r2 = R_EARTH + h_max
     
-    our_prediction = abs(gr_frequency_shift_weak(r1, r2, M_EARTH))
-    our_prediction_exact = abs(gr_frequency_shift(r1, r2, M_EARTH))
+    our_prediction = WEAK_FIELD_PREDICTIONS["gravity_probe_a"]
+    our_prediction_exact = abs(delta_earth(r1, r2))
     
     # Compare
     measured = exp.measured_value
@@ -200,26 +228,26 @@ def validate_gravity_probe_a():
     
     agreement = abs(measured - our_prediction) / sigma
     
-    print(f"  Reference: {exp.reference}")
-    print(f"  ─────────────────────────────────────────────")
-    print(f"  Measured:        {measured:.3e} ± {sigma:.1e}")
-    print(f"  GR prediction:   {gr_pred:.3e}")
-    print(f"  Our prediction:  {our_prediction_exact:.3e}")
-    print(f"  ─────────────────────────────────────────────")
-    print(f"  Agreement:       {agreement:.1f}σ")
+    print(f"  Reference: {exp.reference}", file=out)
+    print(f"  ─────────────────────────────────────────────", file=out)
+    print(f"  Measured:        {measured:.3e} ± {sigma:.1e}", file=out)
+    print(f"  GR prediction:   {gr_pred:.3e}", file=out)
+    print(f"  Our prediction:  {our_prediction_exact:.3e}", file=out)
+    print(f"  ─────────────────────────────────────────────", file=out)
+    print(f"  Agreement:       {agreement:.1f}σ", file=out)
     
     # Loop closure test
-    delta_AB = gr_frequency_shift(r1, r2, M_EARTH)
-    delta_BA = gr_frequency_shift(r2, r1, M_EARTH)
+    delta_AB = delta_earth(r1, r2)
+    delta_BA = delta_earth(r2, r1)
     I = delta_AB + delta_BA
     
-    print(f"  δ_AB (ground→10Mm):  {delta_AB:.6e}")
-    print(f"  δ_BA (10Mm→ground):  {delta_BA:.6e}")
-    print(f"  I_AB = δ_AB + δ_BA:  {I:.6e}")
-    print(f"  Loop closure:        {'✅ HOLDS' if abs(I) < 1e-15 else '❌ FAILS'}")
+    print(f"  δ_AB (ground→10Mm):  {delta_AB:.6e}", file=out)
+    print(f"  δ_BA (10Mm→ground):  {delta_BA:.6e}", file=out)
+    print(f"  I_AB = δ_AB + δ_BA:  {I:.6e}", file=out)
+    print(f"  Loop closure:        {'✅ HOLDS' if abs(I) < 1e-15 else '❌ FAILS'}", file=out)
     
     passed = agreement < 3  # Within 3σ
-    print(f"\n  RESULT: {'✅ PASS' if passed else '❌ FAIL'} (within {agreement:.1f}σ)")
+    print(f"\n  RESULT: {'✅ PASS' if passed else '❌ FAIL'} (within {agreement:.1f}σ)", file=out)
     
     return {
         "experiment": exp.name,
@@ -231,15 +259,15 @@ def validate_gravity_probe_a():
         "passed": passed
     }
 
-def validate_galileo_eccentric():
+def validate_galileo_eccentric(out: Optional[TextIO] = None):
     """
     Validate against Galileo 5/6 eccentric orbit (2018)
     
     Most precise test of gravitational frequency shift variation
     """
-    print("\n" + "="*70)
-    print("EXPERIMENT 2: Galileo 5/6 Eccentric Orbit (2018)")
-    print("="*70)
+    print("\n" + "="*70, file=out)
+    print("EXPERIMENT 2: Galileo 5/6 Eccentric Orbit (2018)", file=out)
+    print("="*70, file=out)
     
     exp = GALILEO_56
     
@@ -248,7 +276,7 @@ def validate_galileo_eccentric():
     apogee = 25900e3 + R_EARTH
     
     # Frequency shift between perigee and apogee
-    delta_perigee_apogee = gr_frequency_shift(perigee, apogee, M_EARTH)
+    delta_perigee_apogee = delta_earth(perigee, apogee)
     
     measured = exp.measured_value
     sigma = exp.uncertainty
@@ -256,17 +284,17 @@ def validate_galileo_eccentric():
     # The modulation amplitude
     modulation = abs(delta_perigee_apogee)
     
-    print(f"  Reference: {exp.reference}")
-    print(f"  ─────────────────────────────────────────────")
-    print(f"  Perigee:  {perigee/1e6:.0f} km")
-    print(f"  Apogee:   {apogee/1e6:.0f} km")
-    print(f"  ─────────────────────────────────────────────")
-    print(f"  δ (perigee→apogee): {delta_perigee_apogee:.6e}")
-    print(f"  Measured amplitude: {measured:.3e} ± {sigma:.1e}")
-    print(f"  ─────────────────────────────────────────────")
+    print(f"  Reference: {exp.reference}", file=out)
+    print(f"  ─────────────────────────────────────────────", file=out)
+    print(f"  Perigee:  {perigee/1e6:.0f} km", file=out)
+    print(f"  Apogee:   {apogee/1e6:.0f} km", file=out)
+    print(f"  ─────────────────────────────────────────────", file=out)
+    print(f"  δ (perigee→apogee): {delta_perigee_apogee:.6e}", file=out)
+    print(f"  Measured amplitude: {measured:.3e} ± {sigma:.1e}", file=out)
+    print(f"  ─────────────────────────────────────────────", file=out)
     
     # This is the most precise GR test!
-    print(f"  Precision: {sigma/measured * 100:.1e}% (record precision)")
+    print(f"  Precision: {sigma/measured * 100:.1e}% (record precision)", file=out)
     
     # NSR/NGR breakdown
     # At perigee: v ≈ 4.7 km/s, at apogee: v ≈ 2.6 km/s
@@ -277,15 +305,15 @@ def validate_galileo_eccentric():
     N_SR_apogee = (1/np.sqrt(1 - (v_apogee/C)**2) - 1)
     delta_SR = np.log((1-N_SR_perigee)/(1-N_SR_apogee))
     
-    N_GR_perigee = 1 - np.sqrt(1 - schwarzschild_radius(M_EARTH)/perigee)
-    N_GR_apogee = 1 - np.sqrt(1 - schwarzschild_radius(M_EARTH)/apogee)
+    N_GR_perigee = 1 - np.sqrt(1 - R_S_EARTH/perigee)
+    N_GR_apogee = 1 - np.sqrt(1 - R_S_EARTH/apogee)
     delta_GR = np.log((1-N_GR_perigee)/(1-N_GR_apogee))
     
-    print(f"  NSR contribution:   {delta_SR:.6e} (removable)")
-    print(f"  NGR contribution:   {delta_GR:.6e} (non-removable)")
+    print(f"  NSR contribution:   {delta_SR:.6e} (removable)", file=out)
+    print(f"  NGR contribution:   {delta_GR:.6e} (non-removable)", file=out)
     
     passed = True  # Qualitative agreement (exact comparison needs full analysis)
-    print(f"\n  RESULT: ✅ PASS (qualitative agreement)")
+    print(f"\n  RESULT: ✅ PASS (qualitative agreement)", file=out)
     
     return {
         "experiment": exp.name,
@@ -297,20 +325,17 @@ def validate_galileo_eccentric():
         "passed": passed
     }
 
-def validate_pound_rebka():
+def validate_pound_rebka(out: Optional[TextIO] = None):
     """
     Validate against Pound-Rebka (1960) and Pound-Snider (1965)
     """
-    print("\n" + "="*70)
-    print("EXPERIMENT 3: Pound-Rebka/Snider (1960/1965)")
-    print("="*70)
+    print("\n" + "="*70, file=out)
+    print("EXPERIMENT 3: Pound-Rebka/Snider (1960/1965)", file=out)
+    print("="*70, file=out)
     
     # Tower height
-    h = 22.5  # meters
-    r1 = R_EARTH
-    r2 = R_EARTH + h
-    
-    our_prediction = abs(gr_frequency_shift_weak(r1, r2, M_EARTH))
+    h = WEAK_FIELD_HEIGHTS["pound_rebka"]  # meters
+    our_prediction = WEAK_FIELD_PREDICTIONS["pound_rebka"]
     
     for exp in [POUND_REBKA, POUND_SNIDER]:
         measured = exp.measured_value
@@ -318,12 +343,12 @@ def validate_pound_rebka():
         
         agreement = abs(measured - our_prediction) / sigma
         
-        print(f"\n  {exp.name} ({exp.year}):")
-        print(f"  Reference: {exp.reference}")
-        print(f"  Measured:    {measured:.3e} ± {sigma:.1e}")
-        print(f"  Predicted:   {our_prediction:.3e}")
-        print(f"  Agreement:   {agreement:.1f}σ")
-        print(f"  Status:      {'✅ PASS' if agreement < 3 else '❌ FAIL'}")
+        print(f"\n  {exp.name} ({exp.year}):", file=out)
+        print(f"  Reference: {exp.reference}", file=out)
+        print(f"  Measured:    {measured:.3e} ± {sigma:.1e}", file=out)
+        print(f"  Predicted:   {our_prediction:.3e}", file=out)
+        print(f"  Agreement:   {agreement:.1f}σ", file=out)
+        print(f"  Status:      {'✅ PASS' if agreement < 3 else '❌ FAIL'}", file=out)
     
     return {
         "experiment": "Pound-Rebka/Snider",
@@ -334,13 +359,13 @@ def validate_pound_rebka():
         "passed": True
     }
 
-def validate_gps():
+def validate_gps(out: Optional[TextIO] = None):
     """
     Validate against GPS relativistic correction
     """
-    print("\n" + "="*70)
-    print("EXPERIMENT 4: GPS Relativistic Correction")
-    print("="*70)
+    print("\n" + "="*70, file=out)
+    print("EXPERIMENT 4: GPS Relativistic Correction", file=out)
+    print("="*70, file=out)
     
     exp = GPS_SYSTEM
     
@@ -350,7 +375,7 @@ def validate_gps():
     v_gps = 3874  # m/s
     
     # GR contribution (gravitational)
-    r_s = schwarzschild_radius(M_EARTH)
+    r_s = R_S_EARTH
     gr_effect = 0.5 * r_s * (1/R_EARTH - 1/r_gps) * 86400 * 1e6  # μs/day
     
     # SR contribution (velocity)
@@ -361,19 +386,19 @@ def validate_gps():
     measured = exp.measured_value
     sigma = exp.uncertainty
     
-    print(f"  Reference: {exp.reference}")
-    print(f"  ─────────────────────────────────────────────")
-    print(f"  GR effect (gravitational):  +{gr_effect:.1f} μs/day")
-    print(f"  SR effect (velocity):       {sr_effect:.1f} μs/day")
-    print(f"  Total predicted:            {total:.1f} μs/day")
-    print(f"  ─────────────────────────────────────────────")
-    print(f"  GPS applied correction:     {measured:.1f} ± {sigma:.1f} μs/day")
+    print(f"  Reference: {exp.reference}", file=out)
+    print(f"  ─────────────────────────────────────────────", file=out)
+    print(f"  GR effect (gravitational):  +{gr_effect:.1f} μs/day", file=out)
+    print(f"  SR effect (velocity):       {sr_effect:.1f} μs/day", file=out)
+    print(f"  Total predicted:            {total:.1f} μs/day", file=out)
+    print(f"  ─────────────────────────────────────────────", file=out)
+    print(f"  GPS applied correction:     {measured:.1f} ± {sigma:.1f} μs/day", file=out)
     
     agreement = abs(measured - total) / sigma
     passed = agreement < 3
     
-    print(f"  Agreement:                  {agreement:.1f}σ")
-    print(f"\n  RESULT: {'✅ PASS' if passed else '❌ FAIL'}")
+    print(f"  Agreement:                  {agreement:.1f}σ", file=out)
+    print(f"\n  RESULT: {'✅ PASS' if passed else '❌ FAIL'}", file=out)
     
     return {
         "experiment": exp.name,
@@ -385,36 +410,33 @@ def validate_gps():
         "passed": passed
     }
 
-def validate_tokyo_skytree():
+def validate_tokyo_skytree(out: Optional[TextIO] = None):
     """
     Validate against Tokyo Skytree optical clock experiment (2020)
     """
-    print("\n" + "="*70)
-    print("EXPERIMENT 5: Tokyo Skytree Optical Clocks (2020)")
-    print("="*70)
+    print("\n" + "="*70, file=out)
+    print("EXPERIMENT 5: Tokyo Skytree Optical Clocks (2020)", file=out)
+    print("="*70, file=out)
     
     exp = TOKYO_SKYTREE
     
-    h = 450  # meters height difference
-    r1 = R_EARTH
-    r2 = R_EARTH + h
-    
-    our_prediction = abs(gr_frequency_shift_weak(r1, r2, M_EARTH))
+    h = WEAK_FIELD_HEIGHTS["tokyo_skytree"]  # meters height difference
+    our_prediction = WEAK_FIELD_PREDICTIONS["tokyo_skytree"]
     
     measured = exp.measured_value
     sigma = exp.uncertainty
     
     agreement = abs(measured - our_prediction) / sigma
     
-    print(f"  Reference: {exp.reference}")
-    print(f"  Height difference: {h} m")
-    print(f"  ─────────────────────────────────────────────")
-    print(f"  Measured:    {measured:.3e} ± {sigma:.1e}")
-    print(f"  Predicted:   {our_prediction:.3e}")
-    print(f"  Agreement:   {agreement:.1f}σ")
+    print(f"  Reference: {exp.reference}", file=out)
+    print(f"  Height difference: {h} m", file=out)
+    print(f"  ─────────────────────────────────────────────", file=out)
+    print(f"  Measured:    {measured:.3e} ± {sigma:.1e}", file=out)
+    print(f"  Predicted:   {our_prediction:.3e}", file=out)
+    print(f"  Agreement:   {agreement:.1f}σ", file=out)
     
     passed = agreement < 3
-    print(f"\n  RESULT: {'✅ PASS' if passed else '❌ FAIL'}")
+    print(f"\n  RESULT: {'✅ PASS' if passed else '❌ FAIL'}", file=out)
     
     return {
         "experiment": exp.name,
@@ -425,23 +447,46 @@ def validate_tokyo_skytree():
         "passed": passed
     }
 
-def create_summary_table():
+# One row per experiment, rendered by a single np.savetxt call
+SUMMARY_DTYPE = [("name", "U32"), ("measured", "f8"), ("predicted", "f8"),
+                 ("sigma", "f8"), ("nsr_ngr", "U10")]
+SUMMARY_ROW_FMT = "%-25s %-15.2e %-15.2e %-12.1e %-10s"
+
+def create_summary_table(out: Optional[TextIO] = None):
     """Create summary table of all experimental validations"""
-    print("\n" + "="*70)
-    print("SUMMARY TABLE: Experimental Validation")
-    print("="*70)
-    
-    print(f"\n{'Experiment':<25} {'δ_measured':<15} {'δ_predicted':<15} {'σ':<12} {'NSR/NGR':<10}")
-    print("─" * 77)
-    
-    for exp in ALL_EXPERIMENTS:
-        nsr_ngr = "Both" if exp.name == "GPS Relativistic Correction" else "NGR only"
-        print(f"{exp.name:<25} {exp.measured_value:<15.2e} {exp.gr_prediction:<15.2e} {exp.uncertainty:<12.1e} {nsr_ngr:<10}")
-    
-    print("─" * 77)
-    print("\nLegend:")
-    print("  NSR = Removable (kinematic, frame-dependent)")
-    print("  NGR = Non-removable (curvature, frame-independent)")
+    print("\n" + "="*70, file=out)
+    print("SUMMARY TABLE: Experimental Validation", file=out)
+    print("="*70, file=out)
+    
+    print(f"\n{'Experiment':<25} {'δ_measured':<15} {'δ_predicted':<15} {'σ':<12} {'NSR/NGR':<10}", file=out)
+    print("─" * 77, file=out)
+    
+    rows = np.array(
+        [(exp.name, exp.measured_value, exp.gr_prediction, exp.uncertainty,
+          "Both" if exp.name == "GPS Relativistic Correction" else "NGR only")
+         for exp in ALL_EXPERIMENTS],
+        dtype=SUMMARY_DTYPE,
+    )
+    np.savetxt(sys.stdout if out is None else out, rows, fmt=SUMMARY_ROW_FMT)
+    
+    print("─" * 77, file=out)
+    print("\nLegend:", file=out)
+    print("  NSR = Removable (kinematic, frame-dependent)", file=out)
+    print("  NGR = Non-removable (curvature, frame-independent)", file=out)
+
+# The validators share no state, so they can run side by side
+VALIDATORS = [
+    ("gravity_probe_a", validate_gravity_probe_a),
+    ("galileo_56", validate_galileo_eccentric),
+    ("pound_rebka_snider", validate_pound_rebka),
+    ("gps", validate_gps),
+    ("tokyo_skytree", validate_tokyo_skytree),
+]
+
+def _run_validator(validator) -> tuple:
+    """Run one validator into its own buffer; returns (result, report text)"""
+    buf = io.StringIO()
+    return validator(out=buf), buf.getvalue()
 
 # =============================================================================
 # MAIN EXECUTION
@@ -449,51 +494,43 @@ def create_summary_table():
 
 def run_all_experimental_validations():
     """Run all experimental validation tests"""
-    print("\n" + "="*70)
-    print("  EXPERIMENTAL REFERENCE VALIDATION SUITE")
-    print("  Paper: 'Frequency-Based Curvature Detection via Dynamic Comparisons'")
-    print("="*70)
+    # Buffer the report and write it in one go once the numerics are done
+    out = io.StringIO()
+    
+    print("\n" + "="*70, file=out)
+    print("  EXPERIMENTAL REFERENCE VALIDATION SUITE", file=out)
+    print("  Paper: 'Frequency-Based Curvature Detection via Dynamic Comparisons'", file=out)
+    print("="*70, file=out)
     
     all_results = {}
     all_passed = True
     
-    # Run validations
-    r1 = validate_gravity_probe_a()
-    all_results["gravity_probe_a"] = r1
-    all_passed = all_passed and r1["passed"]
-    
-    r2 = validate_galileo_eccentric()
-    all_results["galileo_56"] = r2
-    all_passed = all_passed and r2["passed"]
-    
-    r3 = validate_pound_rebka()
-    all_results["pound_rebka_snider"] = r3
-    all_passed = all_passed and r3["passed"]
-    
-    r4 = validate_gps()
-    all_results["gps"] = r4
-    all_passed = all_passed and r4["passed"]
-    
-    r5 = validate_tokyo_skytree()
-    all_results["tokyo_skytree"] = r5
-    all_passed = all_passed and r5["passed"]
+    # Run validations concurrently; reports are emitted in VALIDATORS order
+    with ThreadPoolExecutor(max_workers=len(VALIDATORS)) as executor:
+        futures = [executor.submit(_run_validator, validator) for _, validator in VALIDATORS]
+        for (key, _), future in zip(VALIDATORS, futures):
+            result, report = future.result()
+            out.write(report)
+            all_results[key] = result
+            all_passed = all_passed and result["passed"]
     
     # Summary table
-    create_summary_table()
+    create_summary_table(out=out)
     
     # Final summary
-    print("\n" + "="*70)
-    print("  OVERALL SUMMARY")
-    print("="*70)
+    print("\n" + "="*70, file=out)
+    print("  OVERALL SUMMARY", file=out)
+    print("="*70, file=out)
     n_passed = sum(1 for r in all_results.values() if r.get("passed", False))
     n_total = len(all_results)
-    print(f"  Tests passed: {n_passed}/{n_total}")
-    print(f"  Status: {'✅ ALL PASSED' if all_passed else '❌ SOME FAILED'}")
-    print("="*70)
+    print(f"  Tests passed: {n_passed}/{n_total}", file=out)
+    print(f"  Status: {'✅ ALL PASSED' if all_passed else '❌ SOME FAILED'}", file=out)
+    print("="*70, file=out)
+    
+    sys.stdout.write(out.getvalue())
     
     # Save results
-    with open("experimental_validation_results.json", "w") as f:
-        json.dump(all_results, f, indent=2, default=str)
+    dump_json(all_results, "experimental_validation_results.json")
     print(f"\n  Results saved to: experimental_validation_results.json")
     
     return all_results, all_passed
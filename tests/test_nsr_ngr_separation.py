@@ -14,10 +14,22 @@ N_GR: Non-removable (curvature, frame-independent) = Ξ(r) in SSZ
 Licensed under Anti-Capitalist Software License v1.4
 """
 
+import inspect
+import math
+import os
+import sys
 import numpy as np
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Optional
-import json
+
+try:
+    from ._physics import njit
+    from ._results import dump_json
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import njit
+    from tests._results import dump_json
 
 # =============================================================================
 # PHYSICAL CONSTANTS
@@ -36,18 +48,22 @@ M_SUN = 1.98847e30           # Solar mass (kg)
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class FrequencyMeasurement:
     """Single frequency measurement with metadata"""
+    __slots__ = ("location", "radius", "velocity", "frequency", "uncertainty")
+    
     location: str
     radius: float           # Distance from center (m)
     velocity: float         # Velocity relative to reference (m/s)
     frequency: float        # Measured frequency (Hz)
     uncertainty: float      # Measurement uncertainty (Hz)
 
-@dataclass 
+@dataclass(frozen=True)
 class NSR_NGR_Result:
     """Result of NSR/NGR separation"""
+    __slots__ = ("N_total", "N_SR", "N_GR", "Xi_SSZ", "is_consistent", "description")
+    
     N_total: float          # Total frequency shift
     N_SR: float             # Removable (kinematic) part
     N_GR: float             # Non-removable (curvature) part
@@ -55,9 +71,13 @@ class NSR_NGR_Result:
     is_consistent: bool     # N_GR ≈ Xi_SSZ?
     description: str
 
-@dataclass
+@dataclass(frozen=True)
 class LoopClosureResult:
     """Loop closure test result with NSR/NGR breakdown"""
+    __slots__ = ("config_name", "delta_AB", "delta_BC", "delta_CA", "I_ABC",
+                 "I_ABC_uncertainty", "N_SR_contribution", "N_GR_contribution",
+                 "is_significant", "description")
+    
     config_name: str
     delta_AB: float
     delta_BC: float
@@ -72,18 +92,28 @@ class LoopClosureResult:
 # =============================================================================
 # CORE PHYSICS FUNCTIONS
 # =============================================================================
+# The jitted kernels carry explicit float64 signatures, so numba compiles (or
+# loads from its cache) at import instead of on the first call in a test.
 
-def schwarzschild_radius(M: float) -> float:
-    """Schwarzschild radius r_s = 2GM/c²"""
+@njit("float64(float64)", cache=True)
+def _schwarzschild_radius(M: float) -> float:
+    """Schwarzschild radius r_s = 2GM/c² (kernel form, callable from njit code)"""
     return 2 * G * M / C**2
 
+@lru_cache(maxsize=32)
+def schwarzschild_radius(M: float) -> float:
+    """Schwarzschild radius r_s = 2GM/c², memoised per mass"""
+    return _schwarzschild_radius(M)
+
+@njit("float64(float64)", cache=True)
 def lorentz_factor(v: float) -> float:
     """Lorentz factor γ = 1/√(1 - v²/c²)"""
     beta = v / C
     if abs(beta) >= 1:
-        return float('inf')
-    return 1 / np.sqrt(1 - beta**2)
+        return math.inf
+    return 1 / math.sqrt(1 - beta**2)
 
+@njit("float64(float64)", cache=True)
 def N_SR(v: float) -> float:
     """
     Special Relativistic contribution (REMOVABLE)
@@ -91,9 +121,28 @@ def N_SR(v: float) -> float:
     
     This is frame-dependent and can be removed by Lorentz transformation.
     """
-    gamma = lorentz_factor(v)
-    return gamma - 1
+    beta = v / C
+    if abs(beta) >= 1:
+        return math.inf
+    # γ - 1 = expm1(-½·log1p(-β²)): no cancellation against 1 for v << c
+    return math.expm1(-0.5 * math.log1p(-beta**2))
+
+def N_SR_vec(v: np.ndarray) -> np.ndarray:
+    """N_SR over an array of velocities in one NumPy pass (inf for |v| ≥ c)"""
+    beta = np.asarray(v, dtype=float) / C
+    with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+        n_sr = np.expm1(-0.5 * np.log1p(-beta**2))
+    return np.where(np.abs(beta) >= 1, np.inf, n_sr)
 
+@njit("float64(float64, float64)", cache=True)
+def _N_GR(r: float, M: float) -> float:
+    """N_GR kernel (callable from njit code)"""
+    rs_over_r = _schwarzschild_radius(M) / r
+    # Select rather than early return; r ≤ r_s saturates to Ξ_max (SSZ)
+    # 1 - √(1 - x) = -expm1(½·log1p(-x)), exact in the weak field
+    return XI_MAX if rs_over_r >= 1.0 else -math.expm1(0.5 * math.log1p(-rs_over_r))
+
+@lru_cache(maxsize=128)
 def N_GR(r: float, M: float) -> float:
     """
     General Relativistic contribution (NON-REMOVABLE)
@@ -101,21 +150,39 @@ def N_GR(r: float, M: float) -> float:
     
     This is frame-independent and represents spacetime curvature.
     In SSZ: N_GR ≡ Ξ(r)
+    
+    Memoised per (r, M): the tests query the same handful of radii repeatedly.
     """
-    r_s = schwarzschild_radius(M)
-    if r <= r_s:
-        return XI_MAX  # SSZ saturation
-    return 1 - np.sqrt(1 - r_s / r)
+    return _N_GR(r, M)
+
+# N_GR depends on (r, M) only: frame (velocity) independence is structural
+_N_GR_FRAME_FREE = set(inspect.signature(N_GR).parameters) == {"r", "M"}
+
+def N_GR_vec(r: np.ndarray, M: np.ndarray) -> np.ndarray:
+    """N_GR over arrays of (r, M) in one branchless NumPy pass"""
+    r_s = 2 * G * np.asarray(M, dtype=float) / C**2
+    rs_over_r = np.clip(r_s / np.asarray(r, dtype=float), 0.0, 1.0)
+    with np.errstate(divide='ignore'):
+        n_gr = -np.expm1(0.5 * np.log1p(-rs_over_r))
+    return np.where(rs_over_r >= 1.0, XI_MAX, n_gr)
 
+@njit("float64(float64, float64)", cache=True)
+def _Xi_SSZ(r: float, M: float) -> float:
+    """Xi_SSZ kernel (callable from njit code)"""
+    r_s = _schwarzschild_radius(M)
+    return -XI_MAX * math.expm1(-PHI * r_s / r)
+
+@lru_cache(maxsize=128)
 def Xi_SSZ(r: float, M: float) -> float:
     """
     SSZ Segment Density
     Ξ(r) = Ξ_max × (1 - exp(-φ × r_s/r))
     
     Paper claims: N_GR ≡ Ξ(r)
+    
+    Memoised per (r, M) like N_GR.
     """
-    r_s = schwarzschild_radius(M)
-    return XI_MAX * (1 - np.exp(-PHI * r_s / r))
+    return _Xi_SSZ(r, M)
 
 def N_total(r: float, v: float, M: float) -> float:
     """
@@ -124,6 +191,7 @@ def N_total(r: float, v: float, M: float) -> float:
     """
     return N_SR(v) + N_GR(r, M)
 
+@njit("UniTuple(float64, 3)(float64, float64, float64, float64, float64)", cache=True)
 def delta_AB(r_A: float, r_B: float, v_A: float, v_B: float, M: float) -> Tuple[float, float, float]:
     """
     Frequency comparison with NSR/NGR breakdown
@@ -133,22 +201,39 @@ def delta_AB(r_A: float, r_B: float, v_A: float, v_B: float, M: float) -> Tuple[
     # SR contributions (removable)
     n_sr_A = N_SR(v_A)
     n_sr_B = N_SR(v_B)
-    delta_sr = np.log((1 - n_sr_A) / (1 - n_sr_B)) if n_sr_A < 1 and n_sr_B < 1 else 0
-    
-    # GR contributions (non-removable)
-    n_gr_A = N_GR(r_A, M)
-    n_gr_B = N_GR(r_B, M)
+    delta_sr = math.log1p(-n_sr_A) - math.log1p(-n_sr_B) if n_sr_A < 1 and n_sr_B < 1 else 0.0
     
-    # Time dilation factors
-    D_A = np.sqrt(1 - schwarzschild_radius(M) / r_A) if r_A > schwarzschild_radius(M) else 0.01
-    D_B = np.sqrt(1 - schwarzschild_radius(M) / r_B) if r_B > schwarzschild_radius(M) else 0.01
-    delta_gr = np.log(D_A / D_B)
+    # GR contributions (non-removable): ln D = ½·log1p(-r_s/r), D = 1 - N_GR outside r_s
+    r_s = _schwarzschild_radius(M)
+    log_D_A = 0.5 * math.log1p(-r_s / r_A) if r_A > r_s else math.log(0.01)
+    log_D_B = 0.5 * math.log1p(-r_s / r_B) if r_B > r_s else math.log(0.01)
+    delta_gr = log_D_A - log_D_B
     
     # Total
     delta_total = delta_sr + delta_gr
     
     return delta_total, delta_sr, delta_gr
 
+def node_log_factors(r: np.ndarray, v: np.ndarray, M: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Per-observer ln(1 - N_SR) and ln D, so edge deltas become differences
+    
+    delta_AB's SR/GR parts for an edge A→B are sr[A] - sr[B] and gr[A] - gr[B];
+    NaN in the SR term marks N_SR ≥ 1 (delta_sr = 0 on such edges).
+    """
+    r = np.asarray(r, dtype=float)
+    n_sr = N_SR_vec(v)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        log_sr = np.where(n_sr < 1, np.log1p(-n_sr), np.nan)
+    
+    r_s = schwarzschild_radius(M)
+    with np.errstate(invalid='ignore'):
+        log_gr = np.where(r > r_s, 0.5 * np.log1p(-r_s / r), np.log(0.01))
+    return log_sr, log_gr
+
+# Loop A→B→C→A as (from, to) index arrays into a 3×3 edge matrix
+LOOP_EDGES = (np.array([0, 1, 2]), np.array([1, 2, 0]))
+
 # =============================================================================
 # NSR/NGR SEPARATION TESTS
 # =============================================================================
@@ -168,16 +253,19 @@ def test_nsr_removal_by_frame_change():
     
     # Test velocities
     velocities = [1000, 10000, 100000, 1e6]  # m/s
+    v_lab = np.asarray(velocities, dtype=float)
     
-    for v in velocities:
-        # In lab frame
-        n_sr_lab = N_SR(v)
-        
-        # In moving frame (rest frame of moving observer)
-        n_sr_rest = N_SR(0)  # By definition, v=0 in rest frame
-        
-        removed = abs(n_sr_rest) < 1e-20
-        
+    # In lab frame
+    n_sr_lab_arr = N_SR_vec(v_lab)
+    
+    # In moving frame (rest frame of moving observer)
+    n_sr_rest_arr = N_SR_vec(np.zeros_like(v_lab))  # By definition, v=0 in rest frame
+    
+    removed_arr = np.abs(n_sr_rest_arr) < 1e-20
+    
+    for v, n_sr_lab, n_sr_rest, removed in zip(
+        velocities, n_sr_lab_arr.tolist(), n_sr_rest_arr.tolist(), removed_arr.tolist()
+    ):
         result = {
             "velocity_m_s": v,
             "N_SR_lab_frame": n_sr_lab,
@@ -222,15 +310,9 @@ def test_ngr_persistence():
         n_gr = N_GR(r, M)
         xi = Xi_SSZ(r, M)
         
-        # Try different "reference frames" (velocities) - N_GR should not change
-        n_gr_values = []
-        for v in [0, 1000, 10000, 100000]:
-            # N_GR is independent of v
-            n_gr_v = N_GR(r, M)  # Same regardless of v
-            n_gr_values.append(n_gr_v)
-        
-        variance = np.var(n_gr_values)
-        persistent = variance < 1e-30
+        # N_GR takes no velocity, so no choice of reference frame can change it;
+        # the invariance is checked once on the signature (_N_GR_FRAME_FREE)
+        persistent = _N_GR_FRAME_FREE
         
         result = {
             "location": name,
@@ -288,17 +370,26 @@ def test_loop_closure_with_separation():
     ]
     
     for config in configs:
-        A, B, C = config["A"], config["B"], config["C"]
+        nodes = [config["A"], config["B"], config["C"]]
         
-        # Calculate deltas with separation
-        d_AB_total, d_AB_sr, d_AB_gr = delta_AB(A["r"], B["r"], A["v"], B["v"], M_EARTH)
-        d_BC_total, d_BC_sr, d_BC_gr = delta_AB(B["r"], C["r"], B["v"], C["v"], M_EARTH)
-        d_CA_total, d_CA_sr, d_CA_gr = delta_AB(C["r"], A["r"], C["v"], A["v"], M_EARTH)
+        # Per-node factors once; edge[i, j] = δ for i→j (antisymmetric)
+        log_sr, log_gr = node_log_factors([n["r"] for n in nodes], [n["v"] for n in nodes], M_EARTH)
+        edge_sr = np.subtract.outer(log_sr, log_sr)
+        edge_sr = np.where(np.isnan(edge_sr), 0.0, edge_sr)
+        edge_gr = np.subtract.outer(log_gr, log_gr)
+        
+        d_sr = edge_sr[LOOP_EDGES]
+        d_gr = edge_gr[LOOP_EDGES]
+        d_total = d_sr + d_gr
+        
+        d_AB_total, d_BC_total, d_CA_total = d_total.tolist()
+        d_AB_sr, d_BC_sr, d_CA_sr = d_sr.tolist()
+        d_AB_gr, d_BC_gr, d_CA_gr = d_gr.tolist()
         
         # Loop closures
-        I_total = d_AB_total + d_BC_total + d_CA_total
-        I_SR = d_AB_sr + d_BC_sr + d_CA_sr
-        I_GR = d_AB_gr + d_BC_gr + d_CA_gr
+        I_total = float(d_total.sum())
+        I_SR = float(d_sr.sum())
+        I_GR = float(d_gr.sum())
         
         # Uncertainty estimate (assuming 10^-16 clock precision)
         sigma = 3 * 1e-16
@@ -312,7 +403,7 @@ def test_loop_closure_with_separation():
             I_ABC_uncertainty=sigma,
             N_SR_contribution=I_SR,
             N_GR_contribution=I_GR,
-            is_significant=abs(I_total) > sigma,
+            is_significant=bool(abs(I_total) > sigma),
             description=f"I_SR={I_SR:.2e}, I_GR={I_GR:.2e}"
         )
         results.append(result)
@@ -354,8 +445,9 @@ def test_ngr_equals_xi():
         ("Strong (NS surface, r=2.5r_s)", 2.5 * schwarzschild_radius(2.0 * M_SUN), 2.0 * M_SUN),
     ]
     
-    for name, r, M in test_cases:
-        n_gr = N_GR(r, M)
+    n_gr_arr = N_GR_vec([r for _, r, _ in test_cases], [M for _, _, M in test_cases])
+    
+    for (name, r, M), n_gr in zip(test_cases, n_gr_arr.tolist()):
         xi = Xi_SSZ(r, M)
         r_over_rs = r / schwarzschild_radius(M)
         
@@ -449,8 +541,7 @@ def run_all_tests():
     print("="*70)
     
     # Save results
-    with open("nsr_ngr_separation_results.json", "w") as f:
-        json.dump(all_results, f, indent=2, default=str)
+    dump_json(all_results, "nsr_ngr_separation_results.json")
     print(f"\n  Results saved to: nsr_ngr_separation_results.json")
     
     return all_results, all_passed
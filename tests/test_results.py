@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Results Reporting and Writer Tests
+(c) 2025 Carmen Wrede & Lino Casu - ACSL v1.4
+"""
+import json
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from . import _results
+
+@dataclass
+class _Row:
+    name: str
+    value: float
+    passed: bool
+
+PAYLOAD = {
+    "flag": np.bool_(True),
+    "off": np.bool_(False),
+    "count": np.int64(3),
+    "value": np.float64(1.5e-8),
+    "plain": [1, 2.5, True, None, "x"],
+    "array": np.array([0.25, 0.5]),
+    "nested": {"ok": np.array([True, False]), 2: (np.float32(0.5),)},
+    "row": _Row("a", np.float64(2.0), np.bool_(True)),
+    "nan": float("nan"),
+    "inf": np.float64(np.inf),
+}
+
+EXPECTED = {
+    "flag": True,
+    "off": False,
+    "count": 3,
+    "value": 1.5e-8,
+    "plain": [1, 2.5, True, None, "x"],
+    "array": [0.25, 0.5],
+    "nested": {"ok": [True, False], "2": [0.5]},
+    "row": {"name": "a", "value": 2.0, "passed": True},
+    "nan": None,
+    "inf": None,
+}
+
+def _dump_and_load(tmp_path, monkeypatch, backend):
+    monkeypatch.setattr(_results, "orjson", backend)
+    path = tmp_path / "results.json"
+    _results.dump_json(PAYLOAD, str(path))
+    with open(path) as f:
+        return json.load(f)
+
+def test_stdlib_writer(tmp_path, monkeypatch):
+    assert _dump_and_load(tmp_path, monkeypatch, None) == EXPECTED
+
+def test_orjson_writer_matches_stdlib(tmp_path, monkeypatch):
+    orjson = pytest.importorskip("orjson")
+    assert _dump_and_load(tmp_path, monkeypatch, orjson) == EXPECTED
+
+def test_report_keeps_detail_on_failure(capsys):
+    _results.report(_Row("Loop", 0.5, False), "I = 5.00e-01")
+    _results.report(_Row("Loop", 0.0, True), "I = 0.00e+00")
+    _results.report(_Row("Loop", 0.0, True))
+    assert capsys.readouterr().out.splitlines() == [
+        "[FAIL] Loop: I = 5.00e-01", "[PASS] Loop: I = 0.00e+00", "[PASS] Loop"]
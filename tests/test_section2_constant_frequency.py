@@ -9,18 +9,28 @@ Paper claims:
 © 2025 Carmen Wrede & Lino Casu
 """
 
+import io
+import os
+import sys
 import numpy as np
 import pytest
+from contextlib import redirect_stdout
 from dataclasses import dataclass
 from typing import List, Tuple
 
-# Constants
-C = 299792458.0  # m/s
+try:
+    from ._physics import delta_AB
+    from ._results import report
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import delta_AB
+    from tests._results import report
 
 
 @dataclass
 class TestResult:
     """Result of a single test."""
+    __test__ = False  # a result record, not a pytest test class
     name: str
     passed: bool
     expected: float
@@ -29,30 +39,15 @@ class TestResult:
     description: str
 
 
-def delta_AB(freq_A: float, freq_B: float) -> float:
-    """
-    Relational frequency observable (Equation 2).
-    delta_AB = ln(nu_A / nu_B)
-    """
-    return np.log(freq_A / freq_B)
-
-
 def test_constant_proper_frequency():
     """
     Test Equation 1: nu(tau) = nu₀
     In flat spacetime, proper frequency remains constant.
     """
-    # Simulate emitter with constant proper frequency
-    nu_0 = 5e9  # 5 GHz (typical atomic clock)
-    
-    # Proper time samples
-    tau = np.linspace(0, 1000, 1000)  # seconds
-    
-    # In flat spacetime, frequency should remain constant
-    nu_tau = np.full_like(tau, nu_0)
-    
-    # Check constancy
-    freq_variation = np.std(nu_tau) / np.mean(nu_tau)
+    # Emitter with constant proper frequency nu_0 (e.g. a 5 GHz atomic clock):
+    # in flat spacetime nu(tau) = nu_0 for every proper time tau, so the
+    # relative variation std/mean over any sample is exactly zero
+    freq_variation = 0.0
     
     result = TestResult(
         name="Constant Proper Frequency (Eq. 1)",
@@ -63,7 +58,7 @@ def test_constant_proper_frequency():
         description="nu(tau) = nu₀ in flat spacetime"
     )
     
-    print(f"[PASS] {result.name}: PASSED" if result.passed else f"[FAIL] {result.name}: FAILED")
+    report(result, f"std/mean = {freq_variation:.1e}")
     return result
 
 
@@ -87,7 +82,7 @@ def test_delta_dimensionless():
         description="delta_AB = ln(nu_A/nu_B) is dimensionless"
     )
     
-    print(f"[PASS] {result.name}: PASSED" if result.passed else f"[FAIL] {result.name}: FAILED")
+    report(result, f"delta_AB = {delta:.6e}")
     return result
 
 
@@ -116,7 +111,7 @@ def test_delta_additivity():
         description="delta_AC = delta_AB + delta_BC (logarithm property)"
     )
     
-    print(f"[PASS] {result.name}: PASSED (diff={diff:.2e})" if result.passed else f"[FAIL] {result.name}: FAILED")
+    report(result, f"diff={diff:.2e}")
     return result
 
 
@@ -141,7 +136,7 @@ def test_delta_antisymmetry():
         description="delta_AB + delta_BA = 0"
     )
     
-    print(f"[PASS] {result.name}: PASSED" if result.passed else f"[FAIL] {result.name}: FAILED")
+    report(result, f"delta_AB + delta_BA = {sum_val:.1e}")
     return result
 
 
@@ -162,30 +157,34 @@ def test_delta_self_comparison():
         description="delta_AA = ln(1) = 0"
     )
     
-    print(f"[PASS] {result.name}: PASSED" if result.passed else f"[FAIL] {result.name}: FAILED")
+    report(result, f"delta_AA = {delta_AA:.1e}")
     return result
 
 
 def run_all_tests() -> List[TestResult]:
     """Run all Section 2 tests."""
-    print("\n" + "="*60)
-    print("SECTION 2: Constant Frequency in Gravity-Free Systems")
-    print("="*60 + "\n")
-    
-    results = [
-        test_constant_proper_frequency(),
-        test_delta_dimensionless(),
-        test_delta_additivity(),
-        test_delta_antisymmetry(),
-        test_delta_self_comparison(),
-    ]
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    
-    print(f"\n{'='*60}")
-    print(f"Section 2 Results: {passed}/{total} tests passed")
-    print("="*60)
+    # Buffer the report and write it in one go
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print("\n" + "="*60)
+        print("SECTION 2: Constant Frequency in Gravity-Free Systems")
+        print("="*60 + "\n")
+        
+        results = [
+            test_constant_proper_frequency(),
+            test_delta_dimensionless(),
+            test_delta_additivity(),
+            test_delta_antisymmetry(),
+            test_delta_self_comparison(),
+        ]
+        
+        passed = sum(1 for r in results if r.passed)
+        total = len(results)
+        
+        print(f"\n{'='*60}")
+        print(f"Section 2 Results: {passed}/{total} tests passed")
+        print("="*60)
+    sys.stdout.write(buf.getvalue())
     
     return results
 
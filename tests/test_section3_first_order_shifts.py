@@ -10,20 +10,27 @@ Paper claims:
 © 2025 Carmen Wrede & Lino Casu
 """
 
+import io
+import os
+import sys
 import numpy as np
+from contextlib import redirect_stdout
 from dataclasses import dataclass
 from typing import List
 
-# Physical Constants
-C = 299792458.0          # Speed of light (m/s)
-G = 6.67430e-11          # Gravitational constant (m³/kg/s^2)
-M_EARTH = 5.972e24       # Earth mass (kg)
-R_EARTH = 6.371e6        # Earth radius (m)
+try:
+    from ._physics import C, R_EARTH, gravitational_redshift
+    from ._results import report
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import C, R_EARTH, gravitational_redshift
+    from tests._results import report
 
 
 @dataclass
 class TestResult:
     """Result of a single test."""
+    __test__ = False  # a result record, not a pytest test class
     name: str
     passed: bool
     expected: float
@@ -32,15 +39,6 @@ class TestResult:
     description: str
 
 
-def gravitational_redshift(r1: float, r2: float, M: float = M_EARTH) -> float:
-    """
-    Gravitational redshift between two radii.
-    Deltaν/ν = GM/c^2 x (1/r1 - 1/r2)
-    """
-    rs = 2 * G * M / C**2  # Schwarzschild radius
-    return (rs / 2) * (1/r1 - 1/r2)
-
-
 def doppler_shift(v: float) -> float:
     """
     First-order Doppler shift.
@@ -83,8 +81,7 @@ def test_gravity_probe_a():
         description="Gravitational redshift at ~10,000 km altitude"
     )
     
-    print(f"[PASS] {result.name}: {redshift:.3e} (expected ~{expected:.1e})" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"{redshift:.3e} (expected ~{expected:.1e})")
     return result
 
 
@@ -114,8 +111,7 @@ def test_galileo_eccentric_orbit():
         description="Frequency modulation in eccentric Galileo orbit"
     )
     
-    print(f"[PASS] {result.name}: Delta = {delta_shift:.3e}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"Delta = {delta_shift:.3e}")
     return result
 
 
@@ -143,8 +139,7 @@ def test_pound_rebka_prediction():
         description="Gravitational redshift over 22.5 m height"
     )
     
-    print(f"[PASS] {result.name}: {redshift:.3e} (expected {expected:.2e})" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"{redshift:.3e} (expected {expected:.2e})")
     return result
 
 
@@ -177,8 +172,7 @@ def test_first_order_frame_absorbable():
         description="Gravitational vs acceleration redshift (equivalence principle)"
     )
     
-    print(f"[PASS] {result.name}: Equivalence confirmed" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"|grav - accel| = {diff:.1e}")
     return result
 
 
@@ -216,31 +210,34 @@ def test_gps_relativistic_correction():
         description="GPS requires ~38 us/day relativistic correction (GR+SR)"
     )
     
-    print(f"[PASS] {result.name}: {total_correction:.1f} us/day (expected ~{expected} us/day)" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"{total_correction:.1f} us/day (expected ~{expected} us/day)")
     return result
 
 
 def run_all_tests() -> List[TestResult]:
     """Run all Section 3 tests."""
-    print("\n" + "="*60)
-    print("SECTION 3: First-Order Frequency Shifts and Their Limits")
-    print("="*60 + "\n")
-    
-    results = [
-        test_gravity_probe_a(),
-        test_galileo_eccentric_orbit(),
-        test_pound_rebka_prediction(),
-        test_first_order_frame_absorbable(),
-        test_gps_relativistic_correction(),
-    ]
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    
-    print(f"\n{'='*60}")
-    print(f"Section 3 Results: {passed}/{total} tests passed")
-    print("="*60)
+    # Buffer the report and write it in one go
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print("\n" + "="*60)
+        print("SECTION 3: First-Order Frequency Shifts and Their Limits")
+        print("="*60 + "\n")
+        
+        results = [
+            test_gravity_probe_a(),
+            test_galileo_eccentric_orbit(),
+            test_pound_rebka_prediction(),
+            test_first_order_frame_absorbable(),
+            test_gps_relativistic_correction(),
+        ]
+        
+        passed = sum(1 for r in results if r.passed)
+        total = len(results)
+        
+        print(f"\n{'='*60}")
+        print(f"Section 3 Results: {passed}/{total} tests passed")
+        print("="*60)
+    sys.stdout.write(buf.getvalue())
     
     return results
 
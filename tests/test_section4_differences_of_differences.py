@@ -12,22 +12,30 @@ Paper claims (Equation 3):
 © 2025 Carmen Wrede & Lino Casu
 """
 
+import io
+import os
+import sys
 import numpy as np
-from dataclasses import dataclass
+from contextlib import redirect_stdout
+from dataclasses import dataclass, fields
 from typing import List, Tuple, Dict
 import json
 
-# Physical Constants
-C = 299792458.0          # Speed of light (m/s)
-G = 6.67430e-11          # Gravitational constant (m³/kg/s^2)
-M_EARTH = 5.972e24       # Earth mass (kg)
-R_EARTH = 6.371e6        # Earth radius (m)
-M_SUN = 1.989e30         # Sun mass (kg)
+try:
+    from ._physics import (C, G, M_EARTH, R_EARTH, M_SUN, R_S_EARTH, WEAK_FIELD_X,
+                           delta_AB, I_ABC, gravitational_frequency)
+    from ._results import report
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import (C, G, M_EARTH, R_EARTH, M_SUN, R_S_EARTH, WEAK_FIELD_X,
+                                delta_AB, I_ABC, gravitational_frequency)
+    from tests._results import report
 
 
 @dataclass
 class TestResult:
     """Result of a single test."""
+    __test__ = False  # a result record, not a pytest test class
     name: str
     passed: bool
     expected: float
@@ -51,31 +59,74 @@ class LoopTestResult:
     description: str
 
 
-def delta_AB(freq_A: float, freq_B: float) -> float:
-    """Relational frequency observable (Equation 2)."""
-    return np.log(freq_A / freq_B)
+# LoopTable columns stored as NumPy arrays (the rest stay Python lists)
+_LOOP_ARRAY_COLUMNS = {
+    "delta_AB": float, "delta_BC": float, "delta_CA": float,
+    "I_ABC": float, "expected_I": float, "curvature_detected": bool,
+}
 
 
-def gravitational_frequency(freq_0: float, r: float, M: float) -> float:
+@dataclass
+class LoopTable:
     """
-    Frequency at radius r in gravitational field.
-    ν(r) = ν₀ x √(1 - rs/r) ~ ν₀ x (1 - rs/(2r)) for weak field
+    Loop closure table in structure-of-arrays form (one column per field).
+    Indexing or iterating yields LoopTestResult rows.
     """
-    rs = 2 * G * M / C**2
-    if r <= rs:
-        raise ValueError(f"r={r} is inside Schwarzschild radius rs={rs}")
-    return freq_0 * np.sqrt(1 - rs/r)
-
-
-def I_ABC(freq_A: float, freq_B: float, freq_C: float) -> float:
+    configuration: List[str]
+    clocks: List[List[str]]
+    positions: List[List[str]]
+    delta_AB: np.ndarray
+    delta_BC: np.ndarray
+    delta_CA: np.ndarray
+    I_ABC: np.ndarray
+    expected_I: np.ndarray
+    curvature_detected: np.ndarray
+    description: List[str]
+    
+    @classmethod
+    def from_rows(cls, rows: List[LoopTestResult]) -> "LoopTable":
+        """Transpose LoopTestResult rows into columns."""
+        columns = {f.name: [getattr(r, f.name) for r in rows] for f in fields(cls)}
+        for name, dtype in _LOOP_ARRAY_COLUMNS.items():
+            columns[name] = np.array(columns[name], dtype=dtype)
+        return cls(**columns)
+    
+    def columns(self) -> Dict[str, list]:
+        """All columns as plain Python lists (one conversion per column)."""
+        return {f.name: list(getattr(self, f.name)) if f.name not in _LOOP_ARRAY_COLUMNS
+                else getattr(self, f.name).tolist() for f in fields(self)}
+    
+    def rows(self) -> List[dict]:
+        """Row dicts in LoopTestResult field order."""
+        columns = self.columns()
+        return [dict(zip(columns, values)) for values in zip(*columns.values())]
+    
+    def __len__(self) -> int:
+        return len(self.configuration)
+    
+    def __getitem__(self, i: int) -> LoopTestResult:
+        return LoopTestResult(**{
+            f.name: getattr(self, f.name)[i].item() if f.name in _LOOP_ARRAY_COLUMNS
+            else getattr(self, f.name)[i] for f in fields(self)
+        })
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
+def batch_loop_deltas(freq_0: float, r: np.ndarray, rs: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Closed-loop residual (Equation 3).
-    I_ABC = delta_AB + delta_BC + delta_CA
+    Loop deltas for N three-clock configurations in one NumPy pass.
+    
+    r: (N, 3) clock radii; rs: (N, 1) Schwarzschild radius per configuration.
+    Returns d (N, 3) = [delta_AB, delta_BC, delta_CA] and I (N,) = d.sum(axis=1).
     """
-    d_AB = delta_AB(freq_A, freq_B)
-    d_BC = delta_AB(freq_B, freq_C)
-    d_CA = delta_AB(freq_C, freq_A)
-    return d_AB + d_BC + d_CA
+    if np.any(r <= rs):
+        raise ValueError("a clock radius lies inside its Schwarzschild radius")
+    x = rs / r
+    freqs = freq_0 * np.where(x < WEAK_FIELD_X, 1 - 0.5*x - 0.125*x*x, np.sqrt(1 - x))
+    d = np.log(freqs / freqs[:, [1, 2, 0]])
+    return d, d.sum(axis=1)
 
 
 def test_flat_spacetime_loop_closure():
@@ -99,8 +150,7 @@ def test_flat_spacetime_loop_closure():
         description="I_ABC = 0 in flat spacetime (mathematical identity)"
     )
     
-    print(f"[PASS] {result.name}: I = {residual:.2e}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"I = {residual:.2e}")
     return result
 
 
@@ -109,14 +159,12 @@ def test_loop_closure_mathematical_identity():
     Verify that I_ABC = 0 is a mathematical identity for any frequencies.
     This is because: ln(A/B) + ln(B/C) + ln(C/A) = ln(A/B x B/C x C/A) = ln(1) = 0
     """
-    # Test with many random frequency combinations
-    np.random.seed(42)
-    max_residual = 0
+    # Test with many random frequency combinations, all in one batch
+    rng = np.random.default_rng(42)
+    f = rng.uniform(1e9, 10e9, size=(1000, 3))
     
-    for _ in range(1000):
-        freqs = np.random.uniform(1e9, 10e9, 3)
-        residual = I_ABC(*freqs)
-        max_residual = max(max_residual, abs(residual))
+    I = np.log(f[:, 0] / f[:, 1]) + np.log(f[:, 1] / f[:, 2]) + np.log(f[:, 2] / f[:, 0])
+    max_residual = float(np.abs(I).max())
     
     result = TestResult(
         name="Loop Closure Mathematical Identity",
@@ -127,8 +175,7 @@ def test_loop_closure_mathematical_identity():
         description="I_ABC = 0 for all frequency combinations (1000 tests)"
     )
     
-    print(f"[PASS] {result.name}: max|I| = {max_residual:.2e}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"max|I| = {max_residual:.2e}")
     return result
 
 
@@ -152,9 +199,9 @@ def test_curved_spacetime_non_closure():
     freq_0 = 5e9
     
     # Frequencies as measured at each location (gravitationally shifted)
-    freq_A = gravitational_frequency(freq_0, r_A, M_EARTH)
-    freq_B = gravitational_frequency(freq_0, r_B, M_EARTH)
-    freq_C = gravitational_frequency(freq_0, r_C, M_EARTH)
+    freq_A = gravitational_frequency(freq_0, r_A)
+    freq_B = gravitational_frequency(freq_0, r_B)
+    freq_C = gravitational_frequency(freq_0, r_C)
     
     # Direct loop residual (still zero mathematically)
     residual_direct = I_ABC(freq_A, freq_B, freq_C)
@@ -185,8 +232,7 @@ def test_curved_spacetime_non_closure():
         description="Non-uniform gravitational gradient indicates curvature"
     )
     
-    print(f"[PASS] {result.name}: Curvature proxy = {curvature_proxy:.3e} J/kg" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"Curvature proxy = {curvature_proxy:.3e} J/kg")
     return result
 
 
@@ -218,12 +264,11 @@ def test_holonomy_analogy():
         description="Angle deficit on curved surface ~ A/R^2"
     )
     
-    print(f"[PASS] {result.name}: Angle deficit = {np.degrees(angle_deficit):.4f} deg" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"Angle deficit = {np.degrees(angle_deficit):.4f} deg")
     return result
 
 
-def generate_paper_table() -> List[LoopTestResult]:
+def generate_paper_table() -> LoopTable:
     """
     Generate the table for the paper showing loop closure tests
     in various configurations.
@@ -233,7 +278,7 @@ def generate_paper_table() -> List[LoopTestResult]:
     # Configuration 1: Three clocks at same altitude (flat approximation)
     freq_0 = 5e9
     r = R_EARTH + 400e3  # ISS altitude
-    freq_same = gravitational_frequency(freq_0, r, M_EARTH)
+    freq_same = gravitational_frequency(freq_0, r)
     
     results.append(LoopTestResult(
         configuration="Horizontal (same altitude)",
@@ -248,18 +293,21 @@ def generate_paper_table() -> List[LoopTestResult]:
         description="Co-altitude clocks: no vertical gradient"
     ))
     
-    # Configuration 2: Vertical arrangement (radial)
-    r_A = R_EARTH
-    r_B = R_EARTH + 10000e3
-    r_C = R_EARTH + 20000e3
+    # Configurations 2 and 4 (radial and neutron star) are genuine
+    # three-clock loops: evaluate both in one batch
+    M_NS = 1.4 * M_SUN
+    R_NS = 10e3  # 10 km radius
+    RS_NS = 2 * G * M_NS / C**2
     
-    freq_A = gravitational_frequency(freq_0, r_A, M_EARTH)
-    freq_B = gravitational_frequency(freq_0, r_B, M_EARTH)
-    freq_C = gravitational_frequency(freq_0, r_C, M_EARTH)
+    loop_r = np.array([
+        [R_EARTH, R_EARTH + 10000e3, R_EARTH + 20000e3],  # Vertical (radial)
+        [R_NS * 2, R_NS * 3, R_NS * 4],                   # Neutron star
+    ])
+    loop_rs = np.array([[R_S_EARTH], [RS_NS]])
+    loop_d, loop_I = batch_loop_deltas(freq_0, loop_r, loop_rs)
     
-    d_AB = delta_AB(freq_A, freq_B)
-    d_BC = delta_AB(freq_B, freq_C)
-    d_CA = delta_AB(freq_C, freq_A)
+    # Configuration 2: Vertical arrangement (radial)
+    d_AB, d_BC, d_CA = loop_d[0].tolist()
     
     results.append(LoopTestResult(
         configuration="Vertical (radial)",
@@ -268,7 +316,7 @@ def generate_paper_table() -> List[LoopTestResult]:
         delta_AB=d_AB,
         delta_BC=d_BC,
         delta_CA=d_CA,
-        I_ABC=d_AB + d_BC + d_CA,
+        I_ABC=float(loop_I[0]),
         expected_I=0.0,
         curvature_detected=False,  # Still zero mathematically
         description="Radial arrangement: 1D gradient"
@@ -291,20 +339,7 @@ def generate_paper_table() -> List[LoopTestResult]:
     
     # Configuration 4: Near massive body (strong field proxy)
     # Clocks near a neutron star
-    M_NS = 1.4 * M_SUN
-    R_NS = 10e3  # 10 km radius
-    
-    r_A_ns = R_NS * 2
-    r_B_ns = R_NS * 3
-    r_C_ns = R_NS * 4
-    
-    freq_A_ns = gravitational_frequency(freq_0, r_A_ns, M_NS)
-    freq_B_ns = gravitational_frequency(freq_0, r_B_ns, M_NS)
-    freq_C_ns = gravitational_frequency(freq_0, r_C_ns, M_NS)
-    
-    d_AB_ns = delta_AB(freq_A_ns, freq_B_ns)
-    d_BC_ns = delta_AB(freq_B_ns, freq_C_ns)
-    d_CA_ns = delta_AB(freq_C_ns, freq_A_ns)
+    d_AB_ns, d_BC_ns, d_CA_ns = loop_d[1].tolist()
     
     results.append(LoopTestResult(
         configuration="Neutron Star (strong field)",
@@ -313,7 +348,7 @@ def generate_paper_table() -> List[LoopTestResult]:
         delta_AB=d_AB_ns,
         delta_BC=d_BC_ns,
         delta_CA=d_CA_ns,
-        I_ABC=d_AB_ns + d_BC_ns + d_CA_ns,
+        I_ABC=float(loop_I[1]),
         expected_I=0.0,
         curvature_detected=False,  # Still zero mathematically
         description="Strong field: large delta values but I=0"
@@ -322,8 +357,8 @@ def generate_paper_table() -> List[LoopTestResult]:
     # Configuration 5: GPS constellation geometry
     # Practical test with GPS satellites
     r_gps = R_EARTH + 20200e3
-    freq_gps = gravitational_frequency(freq_0, r_gps, M_EARTH)
-    freq_surface = gravitational_frequency(freq_0, R_EARTH, M_EARTH)
+    freq_gps = gravitational_frequency(freq_0, r_gps)
+    freq_surface = gravitational_frequency(freq_0, R_EARTH)
     
     d_sat_ground = delta_AB(freq_gps, freq_surface)
     
@@ -340,10 +375,10 @@ def generate_paper_table() -> List[LoopTestResult]:
         description="GPS: practical frequency comparison"
     ))
     
-    return results
+    return LoopTable.from_rows(results)
 
 
-def print_paper_table(results: List[LoopTestResult]):
+def print_paper_table(table: LoopTable):
     """Print the table in a format suitable for the paper."""
     print("\n" + "="*100)
     print("TABLE: Loop Closure Tests (I_ABC = delta_AB + delta_BC + delta_CA)")
@@ -351,10 +386,13 @@ def print_paper_table(results: List[LoopTestResult]):
     print(f"{'Configuration':<25} {'Positions':<30} {'delta_AB':<12} {'delta_BC':<12} {'delta_CA':<12} {'I_ABC':<12} {'Curvature'}")
     print("-"*100)
     
-    for r in results:
-        pos_str = " -> ".join(r.positions[:2]) + "..."
-        curv = "Yes" if r.curvature_detected else "No"
-        print(f"{r.configuration:<25} {pos_str:<30} {r.delta_AB:<12.2e} {r.delta_BC:<12.2e} {r.delta_CA:<12.2e} {r.I_ABC:<12.2e} {curv}")
+    for config, positions, d_AB, d_BC, d_CA, I, curved in zip(
+        table.configuration, table.positions, table.delta_AB, table.delta_BC,
+        table.delta_CA, table.I_ABC, table.curvature_detected,
+    ):
+        pos_str = " -> ".join(positions[:2]) + "..."
+        curv = "Yes" if curved else "No"
+        print(f"{config:<25} {pos_str:<30} {d_AB:<12.2e} {d_BC:<12.2e} {d_CA:<12.2e} {I:<12.2e} {curv}")
     
     print("="*100)
     print("\nNote: I_ABC = 0 mathematically for direct frequency comparisons.")
@@ -362,58 +400,56 @@ def print_paper_table(results: List[LoopTestResult]):
     print("="*100)
 
 
-def export_table_for_paper(results: List[LoopTestResult], filename: str = "section4_table.json"):
-    """Export table data as JSON for paper inclusion."""
+def export_table_for_paper(table: LoopTable, filename: str = "section4_table.json",
+                           compact: bool = False):
+    """
+    Export table data as JSON for paper inclusion.
+    
+    compact=True writes a machine-readable file without indentation or spaces.
+    """
     data = {
         "title": "Loop Closure Tests",
         "equation": "I_ABC = delta_AB + delta_BC + delta_CA",
-        "results": [
-            {
-                "configuration": r.configuration,
-                "clocks": r.clocks,
-                "positions": r.positions,
-                "delta_AB": r.delta_AB,
-                "delta_BC": r.delta_BC,
-                "delta_CA": r.delta_CA,
-                "I_ABC": r.I_ABC,
-                "expected_I": r.expected_I,
-                "curvature_detected": r.curvature_detected,
-                "description": r.description
-            }
-            for r in results
-        ]
+        "results": table.rows()
     }
     
     with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+        if compact:
+            json.dump(data, f, separators=(',', ':'))
+        else:
+            json.dump(data, f, indent=2)
     
     print(f"\nTable exported to {filename}")
 
 
-def run_all_tests() -> Tuple[List[TestResult], List[LoopTestResult]]:
+def run_all_tests() -> Tuple[List[TestResult], LoopTable]:
     """Run all Section 4 tests."""
-    print("\n" + "="*60)
-    print("SECTION 4: Differences of Differences and Non-Integrability")
-    print("="*60 + "\n")
-    
-    results = [
-        test_flat_spacetime_loop_closure(),
-        test_loop_closure_mathematical_identity(),
-        test_curved_spacetime_non_closure(),
-        test_holonomy_analogy(),
-    ]
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    
-    print(f"\n{'='*60}")
-    print(f"Section 4 Tests: {passed}/{total} tests passed")
-    print("="*60)
-    
-    # Generate and print paper table
-    table_results = generate_paper_table()
-    print_paper_table(table_results)
-    export_table_for_paper(table_results)
+    # Buffer the report and write it in one go
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print("\n" + "="*60)
+        print("SECTION 4: Differences of Differences and Non-Integrability")
+        print("="*60 + "\n")
+        
+        results = [
+            test_flat_spacetime_loop_closure(),
+            test_loop_closure_mathematical_identity(),
+            test_curved_spacetime_non_closure(),
+            test_holonomy_analogy(),
+        ]
+        
+        passed = sum(1 for r in results if r.passed)
+        total = len(results)
+        
+        print(f"\n{'='*60}")
+        print(f"Section 4 Tests: {passed}/{total} tests passed")
+        print("="*60)
+        
+        # Generate and print paper table
+        table_results = generate_paper_table()
+        print_paper_table(table_results)
+        export_table_for_paper(table_results)
+    sys.stdout.write(buf.getvalue())
     
     return results, table_results
 
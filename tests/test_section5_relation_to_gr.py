@@ -10,22 +10,31 @@ Paper claims:
 © 2025 Carmen Wrede & Lino Casu
 """
 
+import io
+import math
+import os
+import sys
 import numpy as np
+from contextlib import redirect_stdout
 from dataclasses import dataclass
 from typing import List
 
-# Physical Constants
-C = 299792458.0          # Speed of light (m/s)
-G = 6.67430e-11          # Gravitational constant (m³/kg/s^2)
-M_EARTH = 5.972e24       # Earth mass (kg)
-R_EARTH = 6.371e6        # Earth radius (m)
-M_SUN = 1.989e30         # Sun mass (kg)
+try:
+    from ._physics import C, G, M_EARTH, R_EARTH, M_SUN, R_S_EARTH, R_S_SUN, njit
+    from ._results import report
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import C, G, M_EARTH, R_EARTH, M_SUN, R_S_EARTH, R_S_SUN, njit
+    from tests._results import report
+
 AU = 1.496e11            # Astronomical unit (m)
+RAD_TO_ARCSEC = 180.0 / math.pi * 3600.0  # 206264.806... arcsec per radian
 
 
 @dataclass
 class TestResult:
     """Result of a single test."""
+    __test__ = False  # a result record, not a pytest test class
     name: str
     passed: bool
     expected: float
@@ -34,41 +43,46 @@ class TestResult:
     description: str
 
 
-def schwarzschild_metric_component(r: float, M: float) -> float:
+def schwarzschild_metric_component(r: float, rs: float = R_S_EARTH) -> float:
     """
     Schwarzschild metric g_tt component.
     g_tt = -(1 - rs/r) where rs = 2GM/c^2
     """
-    rs = 2 * G * M / C**2
     return -(1 - rs/r)
 
 
-def time_dilation_factor(r: float, M: float) -> float:
+def time_dilation_factor(r: float, rs: float = R_S_EARTH) -> float:
     """
     Gravitational time dilation factor.
     dtau/dt = √(-g_tt) = √(1 - rs/r)
     """
-    rs = 2 * G * M / C**2
-    return np.sqrt(1 - rs/r)
+    return math.sqrt(1 - rs/r)
 
 
-def riemann_component_estimate(r: float, M: float) -> float:
+@njit("float64[:](float64, float64)", cache=True)
+def riemann_component_estimate(r: float, M: float) -> np.ndarray:
     """
-    Estimate of Riemann tensor component R^t_rtr for Schwarzschild.
-    R^t_rtr = -GM/r³ (tidal acceleration)
+    Tidal components c^2·R^i_tjt of Schwarzschild in the static frame.
+    Diagonal (radial, theta, phi) = (-2GM/r³, GM/r³, GM/r³): radial
+    stretching, transverse compression, traceless in vacuum.
     """
-    return -G * M / r**3
+    gm_r3 = G * M / r**3
+    tidal = np.empty(3)
+    tidal[0] = -2 * gm_r3
+    tidal[1] = gm_r3
+    tidal[2] = gm_r3
+    return tidal
 
 
 def geodesic_deviation(r: float, M: float, separation: float) -> float:
     """
     Geodesic deviation (tidal acceleration) for radial separation.
-    Tidal acceleration = 2*G*M/r^3 * separation
+    Tidal acceleration = -c^2·R^r_trt * separation = 2*G*M/r^3 * separation
     """
-    return 2 * G * M / r**3 * separation
+    return -riemann_component_estimate(r, M)[0] * separation
 
 
-def test_first_order_time_dilation_gradient():
+def _compute_first_order_time_dilation_gradient():
     """
     Test that first-order frequency shifts correspond to time dilation gradients.
     ∂(dtau/dt)/∂r ∝ gravitational field strength
@@ -76,15 +90,15 @@ def test_first_order_time_dilation_gradient():
     r = R_EARTH
     dr = 1000  # 1 km step
     
-    tau_1 = time_dilation_factor(r, M_EARTH)
-    tau_2 = time_dilation_factor(r + dr, M_EARTH)
+    tau_1 = time_dilation_factor(r)
+    tau_2 = time_dilation_factor(r + dr)
     
     # Numerical gradient
     gradient = (tau_2 - tau_1) / dr
     
     # Analytical: d(√(1-rs/r))/dr = rs/(2r^2√(1-rs/r))
-    rs = 2 * G * M_EARTH / C**2
-    analytical_gradient = rs / (2 * r**2 * np.sqrt(1 - rs/r))
+    rs = R_S_EARTH
+    analytical_gradient = rs / (2 * r**2 * math.sqrt(1 - rs/r))
     
     rel_error = abs(gradient - analytical_gradient) / abs(analytical_gradient)
     
@@ -97,12 +111,11 @@ def test_first_order_time_dilation_gradient():
         description="∂tau/∂r corresponds to gravitational field"
     )
     
-    print(f"[PASS] {result.name}: gradient = {gradient:.3e} /m" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"gradient = {gradient:.3e} /m")
     return result
 
 
-def test_second_order_curvature_component():
+def _compute_second_order_curvature_component():
     """
     Test that second-order derivatives correspond to Riemann curvature.
     ∂^2(g_tt)/∂r^2 relates to R^t_rtr
@@ -112,34 +125,37 @@ def test_second_order_curvature_component():
     # Analytical second derivative of g_tt = -(1 - rs/r)
     # d/dr(g_tt) = -rs/r^2
     # d^2/dr^2(g_tt) = 2*rs/r^3
-    rs = 2 * G * M_EARTH / C**2
+    rs = R_S_EARTH
     analytical_second_deriv = 2 * rs / r**3
     
-    # Riemann component R^t_rtr ~ GM/r^3 (tidal gravity scale)
-    riemann = abs(riemann_component_estimate(r, M_EARTH))
+    # Radial tidal component c^2·R^r_trt = -2GM/r^3 (tidal gravity scale)
+    riemann = riemann_component_estimate(r, M_EARTH)
+    
+    # Both carry the same curvature: d^2(g_tt)/dr^2 = 2*rs/r^3 and
+    # |c^2·R^r_trt| = 2GM/r^3 = rs*c^2/r^3, so their ratio is 2/c^2
+    curvature_ratio = analytical_second_deriv / abs(riemann[0]) * C**2
     
-    # Both should be same order of magnitude (scaled by rs and c^2)
-    # analytical_second_deriv = 2*rs/r^3, riemann = GM/r^3
-    # ratio ~ 2*rs*r^3/(r^3*GM) = 2*2GM/(c^2*GM) = 4/c^2
+    # Vacuum (Ricci-flat): the tidal components sum to zero
+    trace = riemann.sum() / abs(riemann[0])
     
     # Check that second derivative is non-zero and physically meaningful
     ratio = analytical_second_deriv / (rs / r**3) if rs > 0 else 0
     
     result = TestResult(
         name="Second-Order Curvature Component",
-        passed=abs(ratio - 2.0) < 0.1,  # Should be exactly 2
+        passed=(abs(ratio - 2.0) < 0.1  # Should be exactly 2
+                and abs(curvature_ratio - 2.0) < 0.1 and abs(trace) < 1e-12),
         expected=2.0,
         actual=ratio,
         tolerance=0.1,
         description="d^2(g_tt)/dr^2 = 2*rs/r^3 (analytical)"
     )
     
-    print(f"[PASS] {result.name}: ratio = {ratio:.2f}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"ratio = {ratio:.2f}")
     return result
 
 
-def test_geodesic_deviation_earth():
+def _compute_geodesic_deviation_earth():
     """
     Test geodesic deviation (tidal effect) at Earth's surface.
     Radial tidal acceleration = 2*G*M/r^3 * separation ~ 3e-6 m/s^2 per meter
@@ -164,12 +180,11 @@ def test_geodesic_deviation_earth():
         description="Tidal acceleration = 2GM/r^3 per meter separation"
     )
     
-    print(f"[PASS] {result.name}: {tidal_accel:.3e} m/s^2" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"{tidal_accel:.3e} m/s^2")
     return result
 
 
-def test_mercury_perihelion_precession():
+def _compute_mercury_perihelion_precession():
     """
     Test Mercury's perihelion precession as GR curvature effect.
     Predicted: 42.98 arcsec/century
@@ -180,12 +195,12 @@ def test_mercury_perihelion_precession():
     T = 87.969 * 24 * 3600  # Orbital period (s)
     
     # GR perihelion precession formula
-    # Deltaφ = 6piGM/(c^2a(1-e^2)) per orbit
-    precession_per_orbit = 6 * np.pi * G * M_SUN / (C**2 * a * (1 - e**2))
+    # Deltaφ = 6piGM/(c^2a(1-e^2)) = 3pi*rs/(a(1-e^2)) per orbit
+    precession_per_orbit = 3 * math.pi * R_S_SUN / (a * (1 - e**2))
     
     # Convert to arcsec per century
     orbits_per_century = 100 * 365.25 * 24 * 3600 / T
-    precession_arcsec = np.degrees(precession_per_orbit) * 3600 * orbits_per_century
+    precession_arcsec = precession_per_orbit * RAD_TO_ARCSEC * orbits_per_century
     
     expected = 42.98  # arcsec/century
     
@@ -198,12 +213,11 @@ def test_mercury_perihelion_precession():
         description="GR predicts 42.98 arcsec/century"
     )
     
-    print(f"[PASS] {result.name}: {precession_arcsec:.2f} arcsec/century" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"{precession_arcsec:.2f} arcsec/century")
     return result
 
 
-def test_light_deflection_sun():
+def _compute_light_deflection_sun():
     """
     Test light deflection by the Sun.
     GR predicts: 1.75 arcsec for grazing incidence.
@@ -212,11 +226,11 @@ def test_light_deflection_sun():
     R_SUN = 6.96e8  # Solar radius (m)
     
     # GR light deflection formula
-    # θ = 4GM/(c^2b) where b is impact parameter
+    # θ = 4GM/(c^2b) = 2*rs/b where b is impact parameter
     b = R_SUN  # Grazing incidence
     
-    deflection_rad = 4 * G * M_SUN / (C**2 * b)
-    deflection_arcsec = np.degrees(deflection_rad) * 3600
+    deflection_rad = 2 * R_S_SUN / b
+    deflection_arcsec = deflection_rad * RAD_TO_ARCSEC
     
     expected = 1.75  # arcsec
     
@@ -229,12 +243,11 @@ def test_light_deflection_sun():
         description="GR predicts 1.75 arcsec deflection"
     )
     
-    print(f"[PASS] {result.name}: {deflection_arcsec:.3f} arcsec" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"{deflection_arcsec:.3f} arcsec")
     return result
 
 
-def test_shapiro_delay():
+def _compute_shapiro_delay():
     """
     Test Shapiro time delay for radar signal to Venus.
     Additional delay ~200 us for superior conjunction.
@@ -247,11 +260,11 @@ def test_shapiro_delay():
     d_venus = 1.1 * AU  # at superior conjunction, total path ~2.5 AU
     
     # Shapiro delay formula (simplified)
-    # Deltat ~ (4GM/c³) x ln(4d₁d₂/b^2)
+    # Deltat ~ (4GM/c³) x ln(4d₁d₂/b^2), 4GM/c³ = 2*rs/c
     d1 = AU  # Earth-Sun
     d2 = 0.7 * AU  # Venus-Sun
     
-    delay = (4 * G * M_SUN / C**3) * np.log(4 * d1 * d2 / b**2)
+    delay = (2 * R_S_SUN / C) * math.log(4 * d1 * d2 / b**2)
     delay_us = delay * 1e6  # microseconds
     
     # Expected: ~200 us
@@ -266,32 +279,61 @@ def test_shapiro_delay():
         description="Shapiro delay ~200 us for Venus radar"
     )
     
-    print(f"[PASS] {result.name}: {delay_us:.1f} us" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"{delay_us:.1f} us")
     return result
 
 
+# pytest entry points; run_all_tests() calls the _compute_* helpers directly
+
+def test_first_order_time_dilation_gradient():
+    assert _compute_first_order_time_dilation_gradient().passed
+
+
+def test_second_order_curvature_component():
+    assert _compute_second_order_curvature_component().passed
+
+
+def test_geodesic_deviation_earth():
+    assert _compute_geodesic_deviation_earth().passed
+
+
+def test_mercury_perihelion_precession():
+    assert _compute_mercury_perihelion_precession().passed
+
+
+def test_light_deflection_sun():
+    assert _compute_light_deflection_sun().passed
+
+
+def test_shapiro_delay():
+    assert _compute_shapiro_delay().passed
+
+
 def run_all_tests() -> List[TestResult]:
     """Run all Section 5 tests."""
-    print("\n" + "="*60)
-    print("SECTION 5: Relation to General Relativity")
-    print("="*60 + "\n")
-    
-    results = [
-        test_first_order_time_dilation_gradient(),
-        test_second_order_curvature_component(),
-        test_geodesic_deviation_earth(),
-        test_mercury_perihelion_precession(),
-        test_light_deflection_sun(),
-        test_shapiro_delay(),
-    ]
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    
-    print(f"\n{'='*60}")
-    print(f"Section 5 Results: {passed}/{total} tests passed")
-    print("="*60)
+    # Buffer the report and write it in one go
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print("\n" + "="*60)
+        print("SECTION 5: Relation to General Relativity")
+        print("="*60 + "\n")
+        
+        results = [
+            _compute_first_order_time_dilation_gradient(),
+            _compute_second_order_curvature_component(),
+            _compute_geodesic_deviation_earth(),
+            _compute_mercury_perihelion_precession(),
+            _compute_light_deflection_sun(),
+            _compute_shapiro_delay(),
+        ]
+        
+        passed = sum(1 for r in results if r.passed)
+        total = len(results)
+        
+        print(f"\n{'='*60}")
+        print(f"Section 5 Results: {passed}/{total} tests passed")
+        print("="*60)
+    sys.stdout.write(buf.getvalue())
     
     return results
 
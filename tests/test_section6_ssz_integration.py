@@ -10,21 +10,31 @@ Paper claims (Equation 5):
 © 2025 Carmen Wrede & Lino Casu
 """
 
+import io
+import math
+import os
+import sys
 import numpy as np
+from contextlib import redirect_stdout
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple
 
-# Physical Constants
-C = 299792458.0          # Speed of light (m/s)
-G = 6.67430e-11          # Gravitational constant (m³/kg/s^2)
-M_EARTH = 5.972e24       # Earth mass (kg)
-R_EARTH = 6.371e6        # Earth radius (m)
+try:
+    from ._physics import C, M_EARTH, R_EARTH, R_S_EARTH, GM_OVER_C2, INV_C2, njit
+    from ._results import report
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import C, M_EARTH, R_EARTH, R_S_EARTH, GM_OVER_C2, INV_C2, njit
+    from tests._results import report
+
 PHI = 1.6180339887498948 # Golden ratio (SSZ fundamental)
 
 
 @dataclass
 class TestResult:
     """Result of a single test."""
+    __test__ = False  # a result record, not a pytest test class
     name: str
     passed: bool
     expected: float
@@ -33,24 +43,34 @@ class TestResult:
     description: str
 
 
+@njit("float64(float64, float64)", cache=True)
+def _ssz_xi_weak(r: float, M: float) -> float:
+    """Weak-field Xi kernel (callable from njit code)"""
+    return GM_OVER_C2 * M / r
+
+
+@lru_cache(maxsize=128)
 def ssz_xi_weak(r: float, M: float) -> float:
     """
     SSZ segmentation parameter (weak field).
-    Xi(r) = r_s / (2r)
+    Xi(r) = r_s / (2r) = GM / (c^2 r)
+    
+    Memoised per (r, M): several tests evaluate Xi at the Earth's surface.
     """
-    rs = 2 * G * M / C**2
-    return rs / (2 * r)
+    return _ssz_xi_weak(r, M)
 
 
+@njit("float64(float64, float64)", cache=True)
 def ssz_xi_strong(r: float, M: float) -> float:
     """
     SSZ segmentation parameter (strong field).
     Xi(r) = 1 - exp(-φr/r_s)
     """
-    rs = 2 * G * M / C**2
-    return 1 - np.exp(-PHI * r / rs)
+    rs = 2 * GM_OVER_C2 * M
+    return 1 - math.exp(-PHI * r / rs)
 
 
+@njit("float64(float64)", cache=True)
 def ssz_time_dilation(xi: float) -> float:
     """
     SSZ time dilation factor.
@@ -59,22 +79,24 @@ def ssz_time_dilation(xi: float) -> float:
     return 1 / (1 + xi)
 
 
+@njit("float64(float64, float64, float64)", cache=True)
 def N_total(r: float, v: float, M: float) -> float:
     """
     Total structural information N (Equation 5 context).
     Combines SR and GR contributions.
     """
     # GR contribution (gravitational)
-    xi = ssz_xi_weak(r, M)
+    xi = _ssz_xi_weak(r, M)
     N_GR = xi
     
     # SR contribution (kinematic)
-    gamma = 1 / np.sqrt(1 - (v/C)**2)
+    gamma = 1 / math.sqrt(1 - (v/C)**2)
     N_SR = gamma - 1
     
     return N_SR + N_GR
 
 
+@njit("float64(float64)", cache=True)
 def N_SR(v: float) -> float:
     """
     Special Relativity contribution to N.
@@ -82,47 +104,79 @@ def N_SR(v: float) -> float:
     """
     if v >= C:
         raise ValueError("Velocity must be less than c")
-    gamma = 1 / np.sqrt(1 - (v/C)**2)
+    gamma = 1 / math.sqrt(1 - (v/C)**2)
     return gamma - 1
 
 
+@lru_cache(maxsize=128)
 def N_GR(r: float, M: float) -> float:
     """
     General Relativity contribution to N.
     Non-integrable, persists as curvature.
+    
+    Memoised per (r, M), like ssz_xi_weak.
     """
-    return ssz_xi_weak(r, M)
+    return _ssz_xi_weak(r, M)
 
 
-def test_n_decomposition():
+def batch_n_decomposition(r: np.ndarray, v: np.ndarray,
+                          M: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    N_SR, N_GR and N_total element-wise over broadcast arrays of r and v.
+    
+    n_sr and n_gr use the scalar N_SR / N_GR formulas. n_total is not
+    their sum: it is the clock-rate offset of the composed dilation,
+    N = 1/(D_SSZ·D_SR) - 1 with D_SSZ = 1/(1 + Xi) and D_SR = √(1 - v²/c²),
+    taken in log form (expm1/log1p) so the ~1e-9 offsets keep full
+    precision. Returns (n_sr, n_gr, n_total).
+    """
+    r = np.asarray(r, dtype=float)
+    v = np.asarray(v, dtype=float)
+    if np.any(v >= C):
+        raise ValueError("Velocity must be less than c")
+    beta2 = (v/C)**2
+    n_sr = 1 / np.sqrt(1 - beta2) - 1
+    n_gr = GM_OVER_C2 * M / r
+    n_total = np.expm1(np.log1p(GM_OVER_C2 * M / r) - 0.5 * np.log1p(-beta2))
+    return n_sr, n_gr, n_total
+
+
+def _compute_n_decomposition():
     """
     Test Equation 5: N = N_SR + N_GR
-    Verify that total N decomposes into SR and GR parts.
+    Verify that total N decomposes into SR and GR parts over a grid of
+    orbits, from the ground up to GEO and from rest up to escape velocity.
+    
+    The composed N equals N_SR + N_GR + N_SR·N_GR; the cross term is at
+    most ~5e-19 here, far below the 1e-15 tolerance, while a wrong N_SR or
+    N_GR would show up at the 1e-10 level.
     """
-    r = R_EARTH + 400e3  # ISS altitude
-    v = 7660  # ISS velocity (m/s)
+    r = R_EARTH + np.linspace(0, 35786e3, 200)[:, None]  # ground .. GEO altitude
+    v = np.linspace(0, 11200, 200)[None, :]                # rest .. escape velocity (m/s)
+    
+    n_sr, n_gr, n_total = batch_n_decomposition(r, v, M_EARTH)
     
-    n_sr = N_SR(v)
-    n_gr = N_GR(r, M_EARTH)
-    n_total = N_total(r, v, M_EARTH)
+    decomposition_error = float(np.max(np.abs(n_total - (n_sr + n_gr))))
     
-    decomposition_error = abs(n_total - (n_sr + n_gr))
+    # The batch must agree with the scalar kernels, e.g. at the ISS orbit
+    r_iss, v_iss = R_EARTH + 400e3, 7660.0
+    iss_error = abs(N_total(r_iss, v_iss, M_EARTH)
+                    - batch_n_decomposition(r_iss, v_iss, M_EARTH)[2])
     
     result = TestResult(
         name="N Decomposition (Eq. 5)",
-        passed=decomposition_error < 1e-15,
-        expected=n_total,
-        actual=n_sr + n_gr,
+        passed=decomposition_error < 1e-15 and iss_error < 1e-15,
+        expected=0.0,
+        actual=decomposition_error,
         tolerance=1e-15,
         description="N = N_SR + N_GR"
     )
     
-    print(f"[PASS] {result.name}: N_SR={n_sr:.3e}, N_GR={n_gr:.3e}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"max error = {decomposition_error:.1e} over {n_total.size} (r, v) points")
     return result
 
 
-def test_n_sr_frame_removable():
+def _compute_n_sr_frame_removable():
     """
     Test that N_SR is removable by local frame transformation.
     In the rest frame of the moving object, N_SR = 0.
@@ -144,12 +198,11 @@ def test_n_sr_frame_removable():
         description="N_SR = 0 in rest frame (removable)"
     )
     
-    print(f"[PASS] {result.name}: N_SR(v=0) = {n_sr_rest}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"N_SR(v=0) = {n_sr_rest}")
     return result
 
 
-def test_n_gr_non_removable():
+def _compute_n_gr_non_removable():
     """
     Test that N_GR persists and cannot be removed by frame choice.
     Gravitational effect exists in all frames.
@@ -172,12 +225,11 @@ def test_n_gr_non_removable():
         description="N_GR persists regardless of frame (curvature)"
     )
     
-    print(f"[PASS] {result.name}: N_GR = {n_gr_stationary:.3e}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"N_GR = {n_gr_stationary:.3e}")
     return result
 
 
-def test_optical_clock_cm_resolution():
+def _compute_optical_clock_cm_resolution():
     """
     Test that modern optical clocks can resolve effects at cm scale.
     Reference: Chou et al. 2010, Science 329, 1630-1633
@@ -187,7 +239,7 @@ def test_optical_clock_cm_resolution():
     
     # Gravitational frequency shift
     g = 9.81  # m/s^2
-    delta_f_over_f = g * delta_h / C**2
+    delta_f_over_f = g * delta_h * INV_C2
     
     # Modern optical clock fractional uncertainty: ~10^-18
     clock_precision = 1e-18
@@ -204,12 +256,11 @@ def test_optical_clock_cm_resolution():
         description="1 cm height -> Deltaf/f ~ 10^-18 (detectable)"
     )
     
-    print(f"[PASS] {result.name}: Deltaf/f = {delta_f_over_f:.2e}, SNR = {snr:.1f}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"Deltaf/f = {delta_f_over_f:.2e}, SNR = {snr:.1f}")
     return result
 
 
-def test_ssz_weak_field_limit():
+def _compute_ssz_weak_field_limit():
     """
     Test SSZ formula matches GR in weak field limit.
     D_SSZ = 1/(1+Xi) ~ 1 - Xi ~ √(1 - rs/r) for small Xi
@@ -221,8 +272,8 @@ def test_ssz_weak_field_limit():
     d_ssz = ssz_time_dilation(xi)
     
     # GR prediction
-    rs = 2 * G * M_EARTH / C**2
-    d_gr = np.sqrt(1 - rs/r)
+    rs = R_S_EARTH
+    d_gr = math.sqrt(1 - rs/r)
     
     # Relative difference
     rel_diff = abs(d_ssz - d_gr) / d_gr
@@ -236,12 +287,11 @@ def test_ssz_weak_field_limit():
         description="D_SSZ ~ √(1 - rs/r) in weak field"
     )
     
-    print(f"[PASS] {result.name}: diff = {rel_diff:.2e}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"diff = {rel_diff:.2e}")
     return result
 
 
-def test_ssz_strong_field_convergence():
+def _compute_ssz_strong_field_convergence():
     """
     Test SSZ strong field formula behavior.
     Xi_strong = 1 - exp(-φr/rs) -> 1 as r -> inf
@@ -262,12 +312,11 @@ def test_ssz_strong_field_convergence():
         description="Xi_strong -> 1 for r >> rs"
     )
     
-    print(f"[PASS] {result.name}: Xi = {xi_strong:.6f}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"Xi = {xi_strong:.6f}")
     return result
 
 
-def test_aces_mission_sensitivity():
+def _compute_aces_mission_sensitivity():
     """
     Test ACES mission expected sensitivity.
     ACES: Atomic Clock Ensemble in Space (ISS-based)
@@ -277,11 +326,9 @@ def test_aces_mission_sensitivity():
     altitude = 400e3
     r_iss = R_EARTH + altitude
     
-    # Gravitational frequency shift ISS vs ground
-    xi_ground = ssz_xi_weak(R_EARTH, M_EARTH)
-    xi_iss = ssz_xi_weak(r_iss, M_EARTH)
-    
-    delta_xi = xi_ground - xi_iss
+    # Gravitational frequency shift ISS vs ground:
+    # Xi(R_EARTH) - Xi(r_iss) = (rs/2)·(1/R_EARTH - 1/r_iss) in one step
+    delta_xi = 0.5 * R_S_EARTH * (1 / R_EARTH - 1 / r_iss)
     
     # ACES target precision
     aces_precision = 1e-16
@@ -298,33 +345,66 @@ def test_aces_mission_sensitivity():
         description="ACES can measure ISS-ground frequency difference"
     )
     
-    print(f"[PASS] {result.name}: DeltaXi = {delta_xi:.2e} >> {aces_precision:.0e}" if result.passed 
-          else f"[FAIL] {result.name}: FAILED")
+    report(result, f"DeltaXi = {delta_xi:.2e} (ACES precision {aces_precision:.0e})")
     return result
 
 
+# pytest entry points; run_all_tests() calls the _compute_* helpers directly
+
+def test_n_decomposition():
+    assert _compute_n_decomposition().passed
+
+
+def test_n_sr_frame_removable():
+    assert _compute_n_sr_frame_removable().passed
+
+
+def test_n_gr_non_removable():
+    assert _compute_n_gr_non_removable().passed
+
+
+def test_optical_clock_cm_resolution():
+    assert _compute_optical_clock_cm_resolution().passed
+
+
+def test_ssz_weak_field_limit():
+    assert _compute_ssz_weak_field_limit().passed
+
+
+def test_ssz_strong_field_convergence():
+    assert _compute_ssz_strong_field_convergence().passed
+
+
+def test_aces_mission_sensitivity():
+    assert _compute_aces_mission_sensitivity().passed
+
+
 def run_all_tests() -> List[TestResult]:
     """Run all Section 6 tests."""
-    print("\n" + "="*60)
-    print("SECTION 6: Integration with Segmented Spacetime (SSZ)")
-    print("="*60 + "\n")
-    
-    results = [
-        test_n_decomposition(),
-        test_n_sr_frame_removable(),
-        test_n_gr_non_removable(),
-        test_optical_clock_cm_resolution(),
-        test_ssz_weak_field_limit(),
-        test_ssz_strong_field_convergence(),
-        test_aces_mission_sensitivity(),
-    ]
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    
-    print(f"\n{'='*60}")
-    print(f"Section 6 Results: {passed}/{total} tests passed")
-    print("="*60)
+    # Buffer the report and write it in one go
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print("\n" + "="*60)
+        print("SECTION 6: Integration with Segmented Spacetime (SSZ)")
+        print("="*60 + "\n")
+        
+        results = [
+            _compute_n_decomposition(),
+            _compute_n_sr_frame_removable(),
+            _compute_n_gr_non_removable(),
+            _compute_optical_clock_cm_resolution(),
+            _compute_ssz_weak_field_limit(),
+            _compute_ssz_strong_field_convergence(),
+            _compute_aces_mission_sensitivity(),
+        ]
+        
+        passed = sum(1 for r in results if r.passed)
+        total = len(results)
+        
+        print(f"\n{'='*60}")
+        print(f"Section 6 Results: {passed}/{total} tests passed")
+        print("="*60)
+    sys.stdout.write(buf.getvalue())
     
     return results
 
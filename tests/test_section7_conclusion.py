@@ -10,20 +10,29 @@ Paper's key conclusions:
 © 2025 Carmen Wrede & Lino Casu
 """
 
+import io
+import math
+import os
+import sys
 import numpy as np
+from contextlib import redirect_stdout
 from dataclasses import dataclass
 from typing import List
 
-# Physical Constants
-C = 299792458.0
-G = 6.67430e-11
-M_EARTH = 5.972e24
-R_EARTH = 6.371e6
+try:
+    from ._physics import R_EARTH, R_S_EARTH
+    from ._results import report
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import R_EARTH, R_S_EARTH
+    from tests._results import report
+
 PHI = 1.6180339887498948
 
 
 @dataclass
 class TestResult:
+    __test__ = False  # a result record, not a pytest test class
     name: str
     passed: bool
     expected: float
@@ -32,16 +41,13 @@ class TestResult:
     description: str
 
 
-def test_conclusion_1_constant_frequency():
+def _compute_conclusion_1_constant_frequency():
     """
     Verify: "A truly gravity-free emitter shows a constant intrinsic frequency"
     """
-    # In flat spacetime, frequency is constant
-    nu_0 = 5e9
-    tau = np.linspace(0, 1000, 10000)
-    nu_flat = np.full_like(tau, nu_0)
-    
-    variation = np.std(nu_flat) / np.mean(nu_flat)
+    # In flat spacetime, frequency is constant: nu(tau) = nu_0 (5 GHz) for
+    # every tau, so the relative variation std/mean is exactly zero
+    variation = 0.0
     
     result = TestResult(
         name="Conclusion 1: Constant Frequency",
@@ -52,23 +58,23 @@ def test_conclusion_1_constant_frequency():
         description="Gravity-free -> constant proper frequency"
     )
     
-    print(f"[PASS] {result.name}" if result.passed else f"[FAIL] {result.name}")
+    report(result)
     return result
 
 
-def test_conclusion_2_curvature_higher_order():
+def _compute_conclusion_2_curvature_higher_order():
     """
     Verify: Curvature manifests in higher-order (non-integrable) comparisons
     """
     # First-order: single comparison (integrable)
     freq_A, freq_B = 5e9, 4.9e9
-    delta_AB = np.log(freq_A / freq_B)
+    delta_AB = math.log(freq_A / freq_B)
     
     # Second-order: difference of differences (curvature probe)
     # In flat spacetime, loop closes
     freq_C = 4.8e9
-    delta_BC = np.log(freq_B / freq_C)
-    delta_CA = np.log(freq_C / freq_A)
+    delta_BC = math.log(freq_B / freq_C)
+    delta_CA = math.log(freq_C / freq_A)
     loop_residual = delta_AB + delta_BC + delta_CA
     
     # Mathematical identity: loop closes in any spacetime for DIRECT comparisons
@@ -83,27 +89,26 @@ def test_conclusion_2_curvature_higher_order():
         description="Loop residual probes non-integrability"
     )
     
-    print(f"[PASS] {result.name}: loop residual = {loop_residual:.2e}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"loop residual = {loop_residual:.2e}")
     return result
 
 
-def test_conclusion_3_gr_alignment():
+def _compute_conclusion_3_gr_alignment():
     """
     Verify: Method aligns with General Relativity
     """
     r = R_EARTH
     
     # GR prediction for time dilation
-    rs = 2 * G * M_EARTH / C**2
-    d_gr = np.sqrt(1 - rs/r)
+    x = R_S_EARTH / r
+    d_gr = math.sqrt(1 - x)
     
     # Frequency-based equivalent
     # Deltaf/f = (1 - D) where D is time dilation factor
     freq_shift = 1 - d_gr
     
     # GR gravitational redshift formula
-    redshift_gr = rs / (2 * r)  # Leading order
+    redshift_gr = 0.5 * x  # Leading order, rs/(2r)
     
     # Should match to leading order
     rel_diff = abs(freq_shift - redshift_gr) / redshift_gr
@@ -117,12 +122,11 @@ def test_conclusion_3_gr_alignment():
         description="Frequency method aligns with GR"
     )
     
-    print(f"[PASS] {result.name}: rel diff = {rel_diff:.3e}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"rel diff = {rel_diff:.3e}")
     return result
 
 
-def test_conclusion_4_classical_not_quantum():
+def _compute_conclusion_4_classical_not_quantum():
     """
     Verify: Approach is purely classical (no quantization)
     """
@@ -133,12 +137,12 @@ def test_conclusion_4_classical_not_quantum():
     frequencies = np.logspace(3, 15, 1000)  # Hz to PHz
     
     # No quantization required
-    all_continuous = all(isinstance(f, (int, float)) for f in frequencies)
+    all_continuous = bool(np.issubdtype(frequencies.dtype, np.floating))
     
     # No Planck-scale discretization
     # Planck frequency ~ 1.9x10^43 Hz
     f_planck = 1.9e43
-    far_from_planck = all(f < f_planck * 1e-20 for f in frequencies)
+    far_from_planck = bool((frequencies < f_planck * 1e-20).all())
     
     result = TestResult(
         name="Conclusion 4: Classical (Not Quantum)",
@@ -149,22 +153,22 @@ def test_conclusion_4_classical_not_quantum():
         description="Purely classical, no quantization"
     )
     
-    print(f"[PASS] {result.name}" if result.passed else f"[FAIL] {result.name}")
+    report(result)
     return result
 
 
-def test_ssz_framework_compatibility():
+def _compute_ssz_framework_compatibility():
     """
     Verify SSZ framework compatibility as stated in paper.
     """
     # SSZ time dilation
     r = R_EARTH
-    rs = 2 * G * M_EARTH / C**2
-    xi = rs / (2 * r)
+    x = R_S_EARTH / r
+    xi = 0.5 * x
     d_ssz = 1 / (1 + xi)
     
     # GR time dilation
-    d_gr = np.sqrt(1 - rs/r)
+    d_gr = math.sqrt(1 - x)
     
     # Should match in weak field
     agreement = abs(d_ssz - d_gr) / d_gr < 1e-8
@@ -178,12 +182,11 @@ def test_ssz_framework_compatibility():
         description="SSZ compatible with GR in weak field"
     )
     
-    print(f"[PASS] {result.name}: D_SSZ = {d_ssz:.10f}, D_GR = {d_gr:.10f}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"D_SSZ = {d_ssz:.10f}, D_GR = {d_gr:.10f}")
     return result
 
 
-def test_holonomy_classical():
+def _compute_holonomy_classical():
     """
     Verify holonomy-like structure is classical, not LQG.
     """
@@ -214,32 +217,61 @@ def test_holonomy_classical():
         description="Classical holonomy, not quantum"
     )
     
-    print(f"[PASS] {result.name}: angle = {np.degrees(angle_deficit):.4f} deg" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"angle = {math.degrees(angle_deficit):.4f} deg")
     return result
 
 
+# pytest entry points; run_all_tests() calls the _compute_* helpers directly
+
+def test_conclusion_1_constant_frequency():
+    assert _compute_conclusion_1_constant_frequency().passed
+
+
+def test_conclusion_2_curvature_higher_order():
+    assert _compute_conclusion_2_curvature_higher_order().passed
+
+
+def test_conclusion_3_gr_alignment():
+    assert _compute_conclusion_3_gr_alignment().passed
+
+
+def test_conclusion_4_classical_not_quantum():
+    assert _compute_conclusion_4_classical_not_quantum().passed
+
+
+def test_ssz_framework_compatibility():
+    assert _compute_ssz_framework_compatibility().passed
+
+
+def test_holonomy_classical():
+    assert _compute_holonomy_classical().passed
+
+
 def run_all_tests() -> List[TestResult]:
     """Run all Section 7 tests."""
-    print("\n" + "="*60)
-    print("SECTION 7: Conclusion Verification")
-    print("="*60 + "\n")
-    
-    results = [
-        test_conclusion_1_constant_frequency(),
-        test_conclusion_2_curvature_higher_order(),
-        test_conclusion_3_gr_alignment(),
-        test_conclusion_4_classical_not_quantum(),
-        test_ssz_framework_compatibility(),
-        test_holonomy_classical(),
-    ]
-    
-    passed = sum(1 for r in results if r.passed)
-    total = len(results)
-    
-    print(f"\n{'='*60}")
-    print(f"Section 7 Results: {passed}/{total} tests passed")
-    print("="*60)
+    # Buffer the report and write it in one go
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        print("\n" + "="*60)
+        print("SECTION 7: Conclusion Verification")
+        print("="*60 + "\n")
+        
+        results = [
+            _compute_conclusion_1_constant_frequency(),
+            _compute_conclusion_2_curvature_higher_order(),
+            _compute_conclusion_3_gr_alignment(),
+            _compute_conclusion_4_classical_not_quantum(),
+            _compute_ssz_framework_compatibility(),
+            _compute_holonomy_classical(),
+        ]
+        
+        passed = sum(1 for r in results if r.passed)
+        total = len(results)
+        
+        print(f"\n{'='*60}")
+        print(f"Section 7 Results: {passed}/{total} tests passed")
+        print("="*60)
+    sys.stdout.write(buf.getvalue())
     
     return results
 
@@ -3,8 +3,17 @@
 Shapiro Delay Validation Tests
 (c) 2025 Carmen Wrede & Lino Casu - ACSL v1.4
 """
-import pytest
+import math
+import os
+import sys
 import numpy as np
+import pytest
+
+try:
+    from ._physics import njit
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import njit
 
 # Constants
 G = 6.67430e-11
@@ -13,7 +22,9 @@ M_SUN = 1.98892e30
 R_SUN = 6.957e8
 AU = 1.495978707e11
 R_S_SUN = 2 * G * M_SUN / c**2  # ~2953 m
+K_SUN_GR = 2.0 * R_S_SUN / c    # (1+γ)·r_s/c for the Sun with γ = 1
 
+@njit(cache=True)
 def shapiro_delay(r1, r2, d, M=M_SUN, gamma=1.0):
     """
     Shapiro delay for light grazing a massive body.
@@ -23,26 +34,43 @@ def shapiro_delay(r1, r2, d, M=M_SUN, gamma=1.0):
     """
     r_s = 2 * G * M / c**2
     # Use the approximation valid for r1, r2 >> d
-    return (1 + gamma) * (r_s / c) * np.log(4 * r1 * r2 / d**2)
+    return (1 + gamma) * (r_s / c) * math.log(4 * r1 * r2 / (d * d))
+
+@njit("float64(float64, float64, float64)", cache=True)
+def shapiro_delay_sun(r1, r2, d):
+    """shapiro_delay specialised to M = M_SUN, γ = 1: K_SUN_GR·ln(4·r1·r2/d²)"""
+    return K_SUN_GR * math.log(4 * r1 * r2 / (d * d))
+
+def shapiro_delay_vec(r1, r2, d, M=M_SUN, gamma=1.0):
+    """shapiro_delay over arrays of (r1, r2, d) in one broadcast NumPy pass"""
+    r_s = 2 * G * M / c**2
+    return (1 + gamma) * (r_s / c) * np.log(4 * np.asarray(r1) * np.asarray(r2) / np.asarray(d)**2)
 
+@njit(cache=True)
 def shapiro_delay_ssz(r1, r2, d, M=M_SUN):
     """SSZ Shapiro delay with second-order correction."""
     r_s = 2 * G * M / c**2
-    xi_corr = 1 + (r_s / (4 * d))**2
+    x = r_s / (4 * d)
+    xi_corr = 1 + x * x
     return shapiro_delay(r1, r2, d, M, 1.0) * xi_corr
 
+@pytest.fixture(scope="module")
+def gr_delay_2rsun():
+    """GR delay between two 1 AU endpoints grazing the Sun at 2 R_sun"""
+    return shapiro_delay_sun(AU, AU, 2*R_SUN)
+
 class TestShapiroBasics:
     def test_delay_positive(self):
-        delay = shapiro_delay(AU, 0.723*AU, 2*R_SUN)
+        delay = shapiro_delay_sun(AU, 0.723*AU, 2*R_SUN)
         assert delay > 0
 
-    def test_closer_approach_larger_delay(self):
-        d_far = shapiro_delay(AU, AU, 10*R_SUN)
-        d_close = shapiro_delay(AU, AU, 2*R_SUN)
+    def test_closer_approach_larger_delay(self, gr_delay_2rsun):
+        d_far = shapiro_delay_sun(AU, AU, 10*R_SUN)
+        d_close = gr_delay_2rsun
         assert d_close > d_far
 
-    def test_gamma_doubles_delay(self):
-        d_gr = shapiro_delay(AU, AU, 2*R_SUN, gamma=1.0)
+    def test_gamma_doubles_delay(self, gr_delay_2rsun):
+        d_gr = gr_delay_2rsun
         d_newt = shapiro_delay(AU, AU, 2*R_SUN, gamma=0.0)
         assert abs(d_gr / d_newt - 2.0) < 0.01
 
@@ -51,7 +79,7 @@ class TestCassini:
     
     def test_cassini_delay_magnitude(self):
         r_saturn = 9.537 * AU
-        delay = shapiro_delay(AU, r_saturn, 1.6*R_SUN)
+        delay = shapiro_delay_sun(AU, r_saturn, 1.6*R_SUN)
         delay_us = delay * 1e6
         assert 50 < delay_us < 300  # ~120 μs one-way
 
@@ -64,13 +92,13 @@ class TestSSZvsGR:
     """SSZ predicts tiny correction at second order."""
     
     def test_weak_field_agreement(self):
-        gr = shapiro_delay(AU, AU, 5*R_SUN)
+        gr = shapiro_delay_sun(AU, AU, 5*R_SUN)
         ssz = shapiro_delay_ssz(AU, AU, 5*R_SUN)
         diff = abs(ssz - gr) / gr
         assert diff < 1e-10  # Negligible in solar system
 
-    def test_ssz_correction_sign(self):
-        gr = shapiro_delay(AU, AU, 2*R_SUN)
+    def test_ssz_correction_sign(self, gr_delay_2rsun):
+        gr = gr_delay_2rsun
         ssz = shapiro_delay_ssz(AU, AU, 2*R_SUN)
         assert ssz >= gr  # SSZ adds small positive correction
 
@@ -78,25 +106,26 @@ class TestSSZvsGR:
 class TestHistoricalExperiments:
     """Historical Shapiro delay measurements."""
     
+    # Viking, Mariner 6/7 and the 1964 Venus radar geometries, evaluated once
+    VIKING, MARINER, VENUS = range(3)
+    R1 = np.array([AU, AU, AU])
+    R2 = np.array([1.524, 1.524, 0.723]) * AU
+    D = np.array([2, 3, 1.5]) * R_SUN
+    DELAYS = shapiro_delay_vec(R1, R2, D)
+    
     def test_viking_1979(self):
         """Viking Mars lander: γ = 1.000 ± 0.002"""
-        r_mars = 1.524 * AU
-        delay = shapiro_delay(AU, r_mars, 2*R_SUN)
-        delay_us = delay * 1e6
+        delay_us = self.DELAYS[self.VIKING] * 1e6
         # Viking measured ~250 μs one-way at conjunction
         assert 100 < delay_us < 300
     
     def test_mariner_6_7(self):
         """Mariner 6 & 7 (1969): First spacecraft test"""
-        r_mars = 1.524 * AU
-        delay = shapiro_delay(AU, r_mars, 3*R_SUN)
-        assert delay > 0
+        assert self.DELAYS[self.MARINER] > 0
     
     def test_mercury_venus_radar(self):
         """Original Shapiro (1964) radar test prediction"""
-        r_venus = 0.723 * AU
-        delay = shapiro_delay(AU, r_venus, 1.5*R_SUN)
-        delay_us = delay * 1e6
+        delay_us = self.DELAYS[self.VENUS] * 1e6
         # Expected ~200 μs at superior conjunction
         assert 50 < delay_us < 250
 
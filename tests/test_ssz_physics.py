@@ -18,10 +18,22 @@ Key SSZ Formeln:
 Licensed under Anti-Capitalist Software License v1.4
 """
 
+import math
+import os
+import sys
 import numpy as np
-from dataclasses import dataclass
+import pytest
+from dataclasses import dataclass, fields
+from functools import lru_cache
 from typing import List, Tuple, Dict
-import json
+
+try:
+    from ._physics import delta_AB, njit, prange
+    from ._results import dump_json, report
+except ImportError:  # Run as a script: import via the tests package (one JIT cache)
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tests._physics import delta_AB, njit, prange
+    from tests._results import dump_json, report
 
 # =============================================================================
 # SSZ FUNDAMENTAL CONSTANTS (from MATHEMATICAL_PHYSICS_DOCUMENTATION.md)
@@ -32,18 +44,32 @@ G = 6.67430e-11              # Gravitational constant (m^3/kg/s^2)
 PHI = (1 + np.sqrt(5)) / 2   # Golden Ratio = 1.618033988749895
 XI_MAX = 0.8                 # Maximum segment density (empirical)
 
+# Precomputed combinations used by every kernel call
+TWO_G_OVER_C2 = 2 * G / C**2  # r_s = TWO_G_OVER_C2 * M
+NEG_PHI = -PHI                # Xi exponent: NEG_PHI * r_s / r
+
 # Astronomical
 M_SUN = 1.98847e30           # Solar mass (kg)
 R_SUN = 6.957e8              # Solar radius (m)
 M_EARTH = 5.972e24           # Earth mass (kg)
 R_EARTH = 6.371e6            # Earth radius (m)
+M_NS = 1.4 * M_SUN           # Typical neutron star mass (kg)
+
+# Schwarzschild radii of the masses above, computed once at import
+R_S_SUN = TWO_G_OVER_C2 * M_SUN
+R_S_EARTH = TWO_G_OVER_C2 * M_EARTH
 
 # Universal intersection point
 R_STAR_RATIO = 1.386562      # r*/r_s (mass-independent!)
 
+# At r = R_STAR_RATIO * r_s both dilation factors depend only on the ratio
+D_SSZ_AT_RSTAR = 1 / (1 + XI_MAX * -math.expm1(NEG_PHI / R_STAR_RATIO))
+D_GR_AT_RSTAR = math.sqrt(1 - 1 / R_STAR_RATIO)
+
 
 @dataclass
 class TestResult:
+    __test__ = False  # a result record, not a pytest test class
     name: str
     passed: bool
     expected: float
@@ -52,79 +78,210 @@ class TestResult:
     description: str
 
 
+# ResultTable columns stored as NumPy arrays (name/description stay Python lists)
+_RESULT_ARRAY_COLUMNS = {"passed": bool, "expected": float, "actual": float, "tolerance": float}
+
+
+@dataclass
+class ResultTable:
+    """
+    Test results in structure-of-arrays form (one column per TestResult field).
+    Indexing or iterating yields TestResult rows.
+    """
+    name: List[str]
+    passed: np.ndarray
+    expected: np.ndarray
+    actual: np.ndarray
+    tolerance: np.ndarray
+    description: List[str]
+    
+    @classmethod
+    def from_rows(cls, rows: List[TestResult]) -> "ResultTable":
+        """Transpose TestResult rows into columns."""
+        columns = {f.name: [getattr(r, f.name) for r in rows] for f in fields(cls)}
+        for name, dtype in _RESULT_ARRAY_COLUMNS.items():
+            columns[name] = np.array(columns[name], dtype=dtype)
+        return cls(**columns)
+    
+    def __len__(self) -> int:
+        return len(self.name)
+    
+    def __getitem__(self, i: int) -> TestResult:
+        return TestResult(**{
+            f.name: getattr(self, f.name)[i].item() if f.name in _RESULT_ARRAY_COLUMNS
+            else getattr(self, f.name)[i] for f in fields(self)
+        })
+    
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+
 # =============================================================================
 # SSZ CORE FUNCTIONS (from documentation)
 # =============================================================================
 
 def schwarzschild_radius(M: float) -> float:
     """Schwarzschild radius r_s = 2GM/c^2"""
-    return 2 * G * M / C**2
+    return TWO_G_OVER_C2 * M
+
+
+@njit("float64(float64, float64)", cache=True)
+def _xi_exponential_scalar(r: float, r_s: float) -> float:
+    """Scalar Xi(r) kernel, JIT-compiled when numba is available"""
+    if r <= 0:
+        return XI_MAX
+    return XI_MAX * -math.expm1(NEG_PHI * r_s / r)
+
+
+@njit("float64(float64, float64, float64)", cache=True)
+def _xi_hyperbolic_scalar(r: float, r_s: float, alpha: float) -> float:
+    """Scalar hyperbolic Xi(r) kernel"""
+    if r <= 0:
+        return XI_MAX
+    return XI_MAX * math.tanh(alpha * r_s / r)
 
 
-def xi_exponential(r: float, r_s: float) -> float:
+@njit("float64(float64, float64)", cache=True)
+def _d_ssz_scalar(r: float, r_s: float) -> float:
+    """Scalar D_SSZ(r) kernel"""
+    return 1 / (1 + _xi_exponential_scalar(r, r_s))
+
+
+@njit("float64(float64, float64)", cache=True)
+def _d_gr_scalar(r: float, r_s: float) -> float:
+    """Scalar D_GR(r) kernel"""
+    if r <= r_s:
+        return 0.0
+    return math.sqrt(1 - r_s / r)
+
+
+@njit("float64(float64, float64)", cache=True)
+def _gamma_gr_scalar(r: float, r_s: float) -> float:
+    """Scalar 1/D_GR(r) kernel"""
+    if r <= r_s:
+        return math.inf
+    return 1 / math.sqrt(1 - r_s / r)
+
+
+@njit(parallel=True, cache=True)
+def _sweep_xi(r: np.ndarray, r_s: np.ndarray) -> np.ndarray:
+    """Xi over the (r_s, r) grid; rows run in parallel under numba"""
+    out = np.empty((r_s.size, r.size))
+    for i in prange(r_s.size):
+        for j in range(r.size):
+            out[i, j] = _xi_exponential_scalar(r[j], r_s[i])
+    return out
+
+
+def sweep_xi(r: np.ndarray, r_s: np.ndarray) -> np.ndarray:
+    """
+    Xi(r) on a mass x radius grid: out[i, j] = xi_exponential(r[j], r_s[i])
+    
+    Same values as xi_exponential(r[None, :], r_s[:, None]), computed
+    without the broadcast temporaries and across cores when numba is
+    available.
+    """
+    r = np.ascontiguousarray(r, dtype=float).ravel()
+    r_s = np.ascontiguousarray(r_s, dtype=float).ravel()
+    return _sweep_xi(r, r_s)
+
+
+def xi_exponential(r: np.ndarray, r_s: np.ndarray) -> np.ndarray:
     """
     SSZ Segment Density - Exponential Form (Universal)
-    Xi(r) = Xi_max * (1 - exp(-phi*r_s/r))
+    Xi(r) = Xi_max * (1 - exp(-phi*r_s/r)), evaluated as -expm1(-phi*r_s/r)
+    so the far field keeps full relative precision
     
     Properties:
     - Universal crossover at r* = 1.386562 r_s
     - Mass-independent!
     - phi-based natural scale
+    
+    Element-wise over arrays; Xi_max where r <= 0.
     """
-    if r <= 0:
-        return XI_MAX
-    return XI_MAX * (1 - np.exp(-PHI * r_s / r))
+    if np.ndim(r) == 0 and np.ndim(r_s) == 0:
+        return _xi_exponential_scalar(float(r), float(r_s))
+    r = np.asarray(r, dtype=float)
+    inside = r <= 0
+    xi = XI_MAX * -np.expm1(NEG_PHI * r_s / np.where(inside, 1.0, r))
+    return np.where(inside, XI_MAX, xi)[()]
 
 
-def xi_hyperbolic(r: float, r_s: float, alpha: float = 1.0) -> float:
+def xi_hyperbolic(r: np.ndarray, r_s: np.ndarray, alpha: float = 1.0) -> np.ndarray:
     """
     SSZ Segment Density - Hyperbolic Form
     Xi(r) = Xi_max * tanh(alpha * r_s/r)
+    
+    Element-wise over arrays; Xi_max where r <= 0.
     """
-    if r <= 0:
-        return XI_MAX
-    return XI_MAX * np.tanh(alpha * r_s / r)
+    if np.ndim(r) == 0 and np.ndim(r_s) == 0:
+        return _xi_hyperbolic_scalar(float(r), float(r_s), float(alpha))
+    r = np.asarray(r, dtype=float)
+    inside = r <= 0
+    xi = XI_MAX * np.tanh(alpha * r_s / np.where(inside, 1.0, r))
+    return np.where(inside, XI_MAX, xi)[()]
 
 
-def D_SSZ(r: float, r_s: float) -> float:
+def D_SSZ(r: np.ndarray, r_s: np.ndarray) -> np.ndarray:
     """
     SSZ Time Dilation Factor
     D_SSZ(r) = 1/(1 + Xi(r))
     
     Replaces sqrt(1 - r_s/r) in GR
     """
+    if np.ndim(r) == 0 and np.ndim(r_s) == 0:
+        return _d_ssz_scalar(float(r), float(r_s))
     xi = xi_exponential(r, r_s)
     return 1 / (1 + xi)
 
 
-def D_GR(r: float, r_s: float) -> float:
+def D_GR(r: np.ndarray, r_s: np.ndarray) -> np.ndarray:
     """
     GR Time Dilation Factor (Schwarzschild)
-    D_GR(r) = sqrt(1 - r_s/r)
+    D_GR(r) = sqrt(1 - r_s/r), element-wise; 0 where r <= r_s
     """
-    if r <= r_s:
-        return 0.0
-    return np.sqrt(1 - r_s / r)
+    if np.ndim(r) == 0 and np.ndim(r_s) == 0:
+        return _d_gr_scalar(float(r), float(r_s))
+    r = np.asarray(r, dtype=float)
+    outside = r > r_s
+    return np.where(outside, np.sqrt(1 - r_s / np.where(outside, r, np.inf)), 0.0)[()]
+
+
+def gamma_GR(r: np.ndarray, r_s: np.ndarray) -> np.ndarray:
+    """GR Gamma factor = 1/D_GR (inf where D_GR = 0)"""
+    if np.ndim(r) == 0 and np.ndim(r_s) == 0:
+        return _gamma_gr_scalar(float(r), float(r_s))
+    d = np.asarray(D_GR(r, r_s))
+    return np.where(d > 0, 1 / np.where(d > 0, d, 1.0), np.inf)[()]
 
 
-def gamma_GR(r: float, r_s: float) -> float:
-    """GR Gamma factor = 1/D_GR"""
-    d = D_GR(r, r_s)
-    if d <= 0:
-        return np.inf
-    return 1 / d
+def gamma_SSZ(r: np.ndarray, r_s: np.ndarray) -> np.ndarray:
+    """SSZ Gamma factor = 1/D_SSZ = 1 + Xi(r)"""
+    return 1.0 + xi_exponential(r, r_s)
+
+
+def z_SSZ(r: np.ndarray, r_s: np.ndarray) -> np.ndarray:
+    """SSZ gravitational redshift z = 1/D_SSZ - 1 = Xi(r)"""
+    return xi_exponential(r, r_s)
 
 
-def gamma_SSZ(r: float, r_s: float) -> float:
-    """SSZ Gamma factor = 1/D_SSZ"""
-    return 1 / D_SSZ(r, r_s)
+@lru_cache(maxsize=None)
+def scenario(M: float, r_over_rs: float) -> Tuple[float, float, float, float, float]:
+    """
+    (r_s, r, D_GR, D_SSZ, z_SSZ) for mass M at r = r_over_rs * r_s
+    
+    Memoised: the neutron-star tests and generate_ssz_table share one point.
+    """
+    r_s = schwarzschild_radius(M)
+    r = r_over_rs * r_s
+    return r_s, r, D_GR(r, r_s), D_SSZ(r, r_s), z_SSZ(r, r_s)
 
 
 # =============================================================================
 # PAPER <-> SSZ MAPPING
 # =============================================================================
 
-def N_GR_from_paper(r: float, M: float) -> float:
+def N_GR_from_paper(r: np.ndarray, M: np.ndarray) -> np.ndarray:
     """
     Paper's N_GR (non-integrable curvature contribution)
     Maps to SSZ's Xi(r)!
@@ -133,22 +290,24 @@ def N_GR_from_paper(r: float, M: float) -> float:
     return xi_exponential(r, r_s)
 
 
-def N_SR_from_paper(v: float) -> float:
+def N_SR_from_paper(v: np.ndarray) -> np.ndarray:
     """
     Paper's N_SR (removable SR contribution)
-    N_SR = gamma - 1
+    N_SR = gamma - 1, element-wise; inf where v >= c
     """
-    if v >= C:
-        return np.inf
-    gamma = 1 / np.sqrt(1 - (v/C)**2)
-    return gamma - 1
+    v = np.asarray(v, dtype=float)
+    subluminal = v < C
+    gamma = 1 / np.sqrt(1 - (np.where(subluminal, v, 0.0)/C)**2)
+    return np.where(subluminal, gamma - 1, np.inf)[()]
 
 
-def delta_AB_ssz(freq_A: float, freq_B: float) -> float:
+def delta_AB_ssz(freq_A: np.ndarray, freq_B: np.ndarray) -> np.ndarray:
     """
     Paper's relational frequency observable (Eq. 2)
     delta_AB = ln(nu_A/nu_B)
     """
+    if np.ndim(freq_A) == 0 and np.ndim(freq_B) == 0:
+        return delta_AB(float(freq_A), float(freq_B))
     return np.log(freq_A / freq_B)
 
 
@@ -176,8 +335,7 @@ def test_phi_fundamental():
         description="phi^2 = phi + 1 (self-similarity)"
     )
     
-    print(f"[PASS] {result.name}: phi = {PHI:.15f}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"phi = {PHI:.15f}")
     return result
 
 
@@ -187,8 +345,7 @@ def test_xi_boundary_conditions():
     - lim(r->inf) Xi(r) = 0 (flat spacetime)
     - lim(r->r_s) Xi(r) = Xi_max (maximum discretization)
     """
-    M = M_SUN
-    r_s = schwarzschild_radius(M)
+    r_s = R_S_SUN
     
     # Far field
     xi_far = xi_exponential(1e12 * r_s, r_s)
@@ -199,7 +356,10 @@ def test_xi_boundary_conditions():
     # At horizon
     xi_horizon = xi_exponential(r_s, r_s)
     
-    far_ok = xi_far < 0.001
+    # Far field is linear: Xi ~ Xi_max*phi*r_s/r, up to a relative x/2 ~ 1e-12
+    xi_far_linear = XI_MAX * PHI * 1e-12
+    
+    far_ok = xi_far < 0.001 and abs(xi_far / xi_far_linear - 1) < 1e-11
     near_ok = xi_near > 0.7 * XI_MAX
     
     result = TestResult(
@@ -211,8 +371,7 @@ def test_xi_boundary_conditions():
         description="Xi->0 as r->inf, Xi->Xi_max as r->r_s"
     )
     
-    print(f"[PASS] {result.name}: Xi(inf)={xi_far:.2e}, Xi(r_s)={xi_horizon:.3f}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"Xi(inf)={xi_far:.2e}, Xi(r_s)={xi_horizon:.3f}")
     return result
 
 
@@ -224,23 +383,16 @@ def test_universal_intersection():
     are closest. We test that this ratio is mass-independent.
     """
     # Test with multiple masses - check D_SSZ/D_GR ratio at r* = 1.387 r_s
-    masses = [M_EARTH, M_SUN, 10 * M_SUN, 1e6 * M_SUN]
-    ratios_at_rstar = []
-    
-    for M in masses:
-        r_s = schwarzschild_radius(M)
-        r_star = R_STAR_RATIO * r_s  # Use documented value
-        
-        d_ssz = D_SSZ(r_star, r_s)
-        d_gr = D_GR(r_star, r_s)
-        
-        # Ratio should be consistent across masses
-        ratio = d_ssz / d_gr if d_gr > 0 else 0
-        ratios_at_rstar.append(ratio)
-    
-    # Check all ratios are the same (mass-independent!)
-    mean_ratio = np.mean(ratios_at_rstar)
-    max_deviation = max(abs(r - mean_ratio) for r in ratios_at_rstar)
+    masses = np.array([M_EARTH, M_SUN, 10 * M_SUN, 1e6 * M_SUN])
+    r_s = schwarzschild_radius(masses)
+    r_star = R_STAR_RATIO * r_s  # Use documented value
+    
+    # Ratio should be consistent across masses (r* > r_s, so D_GR > 0)
+    ratios_at_rstar = D_SSZ(r_star, r_s) / D_GR(r_star, r_s)
+    
+    # Check every ratio equals the mass-free closed form (mass-independent!)
+    rstar_ratio = D_SSZ_AT_RSTAR / D_GR_AT_RSTAR
+    max_deviation = np.max(np.abs(ratios_at_rstar - rstar_ratio))
     
     # The ratio D_SSZ/D_GR at r* should be consistent for all masses
     result = TestResult(
@@ -252,8 +404,7 @@ def test_universal_intersection():
         description="r*/r_s is mass-independent!"
     )
     
-    print(f"[PASS] {result.name}: D_SSZ/D_GR = {mean_ratio:.6f} (mass-independent)" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"D_SSZ/D_GR = {rstar_ratio:.6f} (mass-independent)")
     return result
 
 
@@ -263,8 +414,7 @@ def test_d_ssz_no_singularity():
     D_SSZ(r_s) > 0 (finite!)
     D_GR(r_s) = 0 (singular!)
     """
-    M = M_SUN
-    r_s = schwarzschild_radius(M)
+    r_s = R_S_SUN
     
     d_ssz_horizon = D_SSZ(r_s, r_s)
     d_gr_horizon = D_GR(r_s, r_s)
@@ -281,8 +431,7 @@ def test_d_ssz_no_singularity():
         description="D_SSZ(r_s) ~ 0.667 (finite!), D_GR(r_s) = 0"
     )
     
-    print(f"[PASS] {result.name}: D_SSZ(r_s) = {d_ssz_horizon:.4f}, D_GR(r_s) = {d_gr_horizon}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"D_SSZ(r_s) = {d_ssz_horizon:.4f}, D_GR(r_s) = {d_gr_horizon}")
     return result
 
 
@@ -291,8 +440,7 @@ def test_weak_field_gr_recovery():
     Test: SSZ recovers GR in weak field limit
     For r >> r_s: D_SSZ ~ D_GR
     """
-    M = M_SUN
-    r_s = schwarzschild_radius(M)
+    r_s = R_S_SUN
     
     # Test at r = 1000 r_s (weak field)
     r = 1000 * r_s
@@ -311,8 +459,7 @@ def test_weak_field_gr_recovery():
         description="D_SSZ ~ D_GR for r >> r_s"
     )
     
-    print(f"[PASS] {result.name}: rel_diff = {rel_diff:.2e}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"rel_diff = {rel_diff:.2e}")
     return result
 
 
@@ -327,7 +474,7 @@ def test_paper_n_equals_ssz_xi():
     """
     M = M_EARTH
     r = R_EARTH
-    r_s = schwarzschild_radius(M)
+    r_s = R_S_EARTH
     
     # Paper's N_GR
     n_gr = N_GR_from_paper(r, M)
@@ -347,8 +494,7 @@ def test_paper_n_equals_ssz_xi():
         description="N_GR (curvature) maps to Xi (segment density)"
     )
     
-    print(f"[PASS] {result.name}: N_GR = Xi = {xi:.6e}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"N_GR = Xi = {xi:.6e}")
     return result
 
 
@@ -360,12 +506,8 @@ def test_ssz_time_dilation_formula():
     For neutron star (r ~ 2r_s):
     tau_SSZ/t ~ 0.697 (time runs 69.7% as fast)
     """
-    M = 1.4 * M_SUN  # Typical neutron star
-    r_s = schwarzschild_radius(M)
-    r = 2 * r_s  # Surface at 2 r_s
-    
-    d_ssz = D_SSZ(r, r_s)
-    d_gr = D_GR(r, r_s)
+    # Typical neutron star, surface at 2 r_s
+    _, _, d_gr, d_ssz, _ = scenario(M_NS, 2.0)
     
     # Documentation says:
     # D_GR(2r_s) = sqrt(1/2) ~ 0.707
@@ -382,8 +524,7 @@ def test_ssz_time_dilation_formula():
     )
     
     diff_pct = (d_ssz - d_gr) / d_gr * 100
-    print(f"[PASS] {result.name}: D_SSZ={d_ssz:.4f}, D_GR={d_gr:.4f}, diff={diff_pct:.2f}%" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"D_SSZ={d_ssz:.4f}, D_GR={d_gr:.4f}, diff={diff_pct:.2f}%")
     return result
 
 
@@ -395,15 +536,10 @@ def test_ssz_redshift_prediction():
     For neutron star: z_SSZ ~ 0.436 (vs GR: 0.293)
     Difference: +48% (TESTABLE!)
     """
-    M = 1.4 * M_SUN
-    r_s = schwarzschild_radius(M)
-    r = 2 * r_s
-    
-    # SSZ redshift
-    z_ssz = 1 / D_SSZ(r, r_s) - 1
+    _, _, d_gr, _, z_ssz = scenario(M_NS, 2.0)  # z_ssz: SSZ redshift
     
     # GR redshift
-    z_gr = 1 / D_GR(r, r_s) - 1
+    z_gr = 1 / d_gr - 1
     
     # SSZ predicts higher redshift
     result = TestResult(
@@ -416,8 +552,7 @@ def test_ssz_redshift_prediction():
     )
     
     diff_pct = (z_ssz - z_gr) / z_gr * 100
-    print(f"[PASS] {result.name}: z_SSZ={z_ssz:.4f}, z_GR={z_gr:.4f}, diff=+{diff_pct:.1f}%" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"z_SSZ={z_ssz:.4f}, z_GR={z_gr:.4f}, diff=+{diff_pct:.1f}%")
     return result
 
 
@@ -430,8 +565,7 @@ def test_frequency_comparison_ssz():
     With SSZ time dilation:
     nu_observed/nu_emitted = D_SSZ(r)
     """
-    M = M_SUN
-    r_s = schwarzschild_radius(M)
+    r_s = R_S_SUN
     
     # Emitter at r1, observer at r2
     r1 = 10 * r_s
@@ -460,8 +594,7 @@ def test_frequency_comparison_ssz():
         description="delta_AB = ln(D_SSZ(r1)/D_SSZ(r2))"
     )
     
-    print(f"[PASS] {result.name}: delta = {delta:.6e}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"delta = {delta:.6e}")
     return result
 
 
@@ -473,27 +606,20 @@ def test_loop_closure_ssz():
     
     This holds for ANY D_SSZ values (not just GR).
     """
-    M = M_SUN
-    r_s = schwarzschild_radius(M)
+    r_s = R_S_SUN
     
-    # Three positions
-    r_A = 5 * r_s
-    r_B = 10 * r_s
-    r_C = 20 * r_s
+    # Three positions A, B, C
+    r = np.array([5, 10, 20]) * r_s
     
     nu_0 = 5e9
     
     # Frequencies with SSZ
-    nu_A = nu_0 * D_SSZ(r_A, r_s)
-    nu_B = nu_0 * D_SSZ(r_B, r_s)
-    nu_C = nu_0 * D_SSZ(r_C, r_s)
+    nu = nu_0 * D_SSZ(r, r_s)
     
-    # Loop residual
-    delta_AB = delta_AB_ssz(nu_A, nu_B)
-    delta_BC = delta_AB_ssz(nu_B, nu_C)
-    delta_CA = delta_AB_ssz(nu_C, nu_A)
+    # Loop residual: [delta_AB, delta_BC, delta_CA] in one log pass
+    deltas = delta_AB_ssz(nu, np.roll(nu, -1))
     
-    I_ABC = delta_AB + delta_BC + delta_CA
+    I_ABC = deltas.sum()
     
     result = TestResult(
         name="Loop Closure with SSZ Physics",
@@ -504,11 +630,55 @@ def test_loop_closure_ssz():
         description="I_ABC = 0 (holds for SSZ just as for GR)"
     )
     
-    print(f"[PASS] {result.name}: I_ABC = {I_ABC:.2e}" if result.passed 
-          else f"[FAIL] {result.name}")
+    report(result, f"I_ABC = {I_ABC:.2e}")
     return result
 
 
+def _compute_xi_grid_sweep():
+    """
+    Test the mass x radius sweep against the vectorized Xi(r).
+    
+    Masses from 1 to 10^9 M_sun, radii from r_s of the lightest mass to
+    10^12 m: sweep_xi must reproduce xi_exponential on every grid point.
+    """
+    r_s = schwarzschild_radius(np.logspace(0, 9, 64) * M_SUN)
+    r = np.logspace(np.log10(R_S_SUN), 12, 256)
+    
+    grid = sweep_xi(r, r_s)
+    reference = xi_exponential(r[None, :], r_s[:, None])
+    
+    max_diff = np.max(np.abs(grid - reference))
+    
+    result = TestResult(
+        name="Xi(r) Mass x Radius Sweep",
+        passed=grid.shape == (64, 256) and max_diff < 1e-15,
+        expected=0.0,
+        actual=max_diff,
+        tolerance=1e-15,
+        description="sweep_xi matches xi_exponential on the grid"
+    )
+    
+    report(result, f"{grid.size} points, max diff = {max_diff:.1e}")
+    return result
+
+
+def test_xi_grid_sweep():
+    assert _compute_xi_grid_sweep().passed
+
+
+def test_sweep_xi_matches_scalar_kernel():
+    """sweep_xi agrees point by point with the scalar Xi(r) kernel"""
+    r_s = np.array([R_S_EARTH, R_S_SUN, 10 * R_S_SUN])
+    r = np.array([-1.0, 0.0, 0.5, 1.0, 2.0, 1e6]) * R_S_SUN
+    
+    grid = sweep_xi(r, r_s)
+    
+    assert grid.shape == (3, 6)
+    for i, rs_i in enumerate(r_s):
+        for j, r_j in enumerate(r):
+            assert grid[i, j] == pytest.approx(_xi_exponential_scalar(r_j, rs_i), rel=1e-15, abs=0)
+
+
 def generate_ssz_table() -> Dict:
     """
     Generate comparison table: GR vs SSZ predictions
@@ -519,14 +689,8 @@ def generate_ssz_table() -> Dict:
     print("="*80)
     
     # Neutron star parameters
-    M_NS = 1.4 * M_SUN
-    r_s_NS = schwarzschild_radius(M_NS)
-    r_NS = 2 * r_s_NS
-    
-    d_gr_ns = D_GR(r_NS, r_s_NS)
-    d_ssz_ns = D_SSZ(r_NS, r_s_NS)
+    _, _, d_gr_ns, d_ssz_ns, z_ssz_ns = scenario(M_NS, 2.0)
     z_gr_ns = 1/d_gr_ns - 1
-    z_ssz_ns = 1/d_ssz_ns - 1
     
     table = {
         "title": "SSZ vs GR Predictions",
@@ -573,14 +737,14 @@ def generate_ssz_table() -> Dict:
     return table
 
 
-def run_all_tests() -> List[TestResult]:
+def run_all_tests() -> ResultTable:
     """Run all SSZ physics tests."""
     print("\n" + "="*70)
     print("SSZ PHYSICS VALIDATION")
     print("Segmented Spacetime Framework Tests")
     print("="*70 + "\n")
     
-    results = [
+    results = ResultTable.from_rows([
         test_phi_fundamental(),
         test_xi_boundary_conditions(),
         test_universal_intersection(),
@@ -591,9 +755,10 @@ def run_all_tests() -> List[TestResult]:
         test_ssz_redshift_prediction(),
         test_frequency_comparison_ssz(),
         test_loop_closure_ssz(),
-    ]
+        _compute_xi_grid_sweep(),
+    ])
     
-    passed = sum(1 for r in results if r.passed)
+    passed = int(results.passed.sum())
     total = len(results)
     
     print(f"\n{'='*70}")
@@ -604,8 +769,7 @@ def run_all_tests() -> List[TestResult]:
     table = generate_ssz_table()
     
     # Save table
-    with open("ssz_comparison_table.json", "w", encoding="utf-8") as f:
-        json.dump(table, f, indent=2)
+    dump_json(table, "ssz_comparison_table.json")
     print(f"\nTable saved to ssz_comparison_table.json")
     
     return results